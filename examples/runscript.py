@@ -40,6 +40,8 @@ else:
     for idx, cmd, error in executor.get_errors():
         print(f"  [{idx}] {cmd}: {error}")
 
-# View logs
-for log in context.get_logs():
-    print(log)
\ No newline at end of file
+# Flush any remaining buffered logs
+context.flush_logs()
+
+# Cleanup
+context.close()
\ No newline at end of file
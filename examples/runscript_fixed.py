@@ -80,11 +80,11 @@ def main():
         for idx, cmd, error in executor.get_errors():
             print(f"  [{idx}] {cmd}: {error}")
     
-    # View logs
-    for log in context.get_logs():
-        print(log)
+    # Flush any remaining buffered logs
+    context.flush_logs()
     
     # Cleanup
+    context.close()
     my_browser_window.close()
     sys.exit(0)
 
@@ -6,14 +6,10 @@ from pathlib import Path
 # Add the src directory to path so we can import qwsengine
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-# IMPORTANT: Create QApplication before importing any Qt-dependent modules
-# SettingsManager uses QWebEngineProfile, which requires Qt to be initialized
-from PySide6.QtWidgets import QApplication
-
-# Create minimal Qt app (doesn't show any windows)
-app = QApplication(sys.argv)
-
+# No QApplication needed: SettingsManager only builds its QWebEngineProfile
+# on first use, and the mock browser never asks for it.
 from qwsengine.scripting import ScriptExecutor, ExecutionContext
+from qwsengine.scripting.utils import write_text_file
 from qwsengine.core.settings import SettingsManager
 
 
@@ -98,6 +94,8 @@ class MockTabManager:
 
 class MockBrowserWindow:
     """Mock browser window for testing/headless mode."""
+    is_mock = True
+    
     def __init__(self, settings_manager=None):
         self.settings_manager = settings_manager
         self.tab_manager = MockTabManager()
@@ -123,15 +121,14 @@ class MockBrowserWindow:
             html_content = tab.html_content
         
         # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        write_text_file(output_path, html_content)
         print(f"[MockBrowser] Saved HTML to: {output_path}")
 
 
 def main():
     """Main function to execute a script with mocks."""
     
-    # Create settings manager (now Qt is initialized)
+    # Create settings manager
     settings_manager = SettingsManager()
     
     # Create mock browser window (no GUI window shown)
@@ -177,13 +174,11 @@ def main():
         for idx, cmd, error in executor.get_errors():
             print(f"  [{idx}] {cmd}: {error}")
     
-    # View logs
-    print("\n--- Execution Logs ---")
-    for log in context.get_logs():
-        print(log)
+    # Flush any remaining buffered logs
+    context.flush_logs()
     
-    # Proper cleanup
-    app.quit()
+    # Cleanup
+    context.close()
 
 
 if __name__ == "__main__":
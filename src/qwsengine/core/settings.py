@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from functools import cached_property
 from pathlib import Path
-import json
 import os
+import threading
 from typing import Any, Dict, Optional
 
 from PySide6.QtCore import QStandardPaths
@@ -11,6 +12,7 @@ from PySide6.QtWebEngineCore import QWebEngineProfile
 
 # Single source of truth for app identity & paths
 from qwsengine.app_info import app_dir, SETTINGS_PATH, CACHE_DIR, DATA_DIR, LOG_DIR
+from qwsengine.utils import serialization
 from .request_interceptor import HeaderInterceptor  # <-- correct name
 
 # Optional imports (don’t crash if not present)
@@ -23,7 +25,7 @@ except Exception:
 class SettingsManager:
     """
     App settings + persistent QWebEngineProfile.
-    Preferred: self.web_profile
+    Preferred: self.web_profile (created lazily on first access)
     Back-compat: self.profile (property) and _setup_web_profile()
     """
     # Legacy → current keys
@@ -35,6 +37,16 @@ class SettingsManager:
         # add more mappings here if your code uses other "a/b" keys
     }
 
+    # Keys read by apply_proxy_settings() / apply_network_overrides()
+    _PROXY_KEYS = frozenset({
+        "proxy_mode", "proxy_type", "proxy_host", "proxy_port",
+        "proxy_user", "proxy_password",
+    })
+    _NETWORK_KEYS = frozenset({
+        "user_agent", "accept_language", "send_dnt",
+        "spoof_chrome_client_hints", "headers_global", "headers_per_host",
+    })
+
     def __init__(self) -> None:
         # ----- directories (used by logger & others) -----------------------
         self.config_dir: Path = DATA_DIR # app_dir(QStandardPaths.AppConfigLocation)
@@ -82,6 +94,13 @@ class SettingsManager:
         # ----- Load settings JSON, merged with defaults --------------------
         self.settings: Dict[str, Any] = self._load_settings()
 
+        # Writes may come from a worker thread (see write_settings); the
+        # lock serializes them and the sequence numbers keep an older
+        # snapshot from overwriting a newer one
+        self._write_lock = threading.Lock()
+        self._snapshot_seq = 0
+        self._written_seq = 0
+
         # ----- Logging -----------------------------------------------------
         self.log_manager = None
         if self.settings.get("logging_enabled", True) and LogManager is not None:
@@ -96,7 +115,14 @@ class SettingsManager:
         self.apply_proxy_settings()
 
         # ----- Persistent WebEngine profile --------------------------------
-        self.web_profile: QWebEngineProfile = self._setup_web_profile()
+        # Not built here: see web_profile. Creating a QWebEngineProfile needs
+        # a running QApplication and is costly, and headless script runs
+        # never touch it.
+
+    @cached_property
+    def web_profile(self) -> QWebEngineProfile:
+        """Persistent WebEngine profile, created on first access."""
+        return self._setup_web_profile()
 
     # ----------------------------------------------------------------------
     # Back-compat surface
@@ -222,7 +248,7 @@ class SettingsManager:
         data: Dict[str, Any] = {}
         if SETTINGS_PATH.exists():
             try:
-                data = json.loads(SETTINGS_PATH.read_text(encoding="utf-8"))
+                data = serialization.loads(SETTINGS_PATH.read_bytes())
             except Exception:
                 data = {}
 
@@ -240,12 +266,44 @@ class SettingsManager:
         try:
             url = self.settings['start_url']
             self.log_info("Settings_Manager", url)
+            snapshot = self.serialize_settings()
+        except Exception as e:
+            self.log_error("SettingsManager", f"Failed to save settings to file: {e}")
+            return False
+        return self.write_settings(snapshot)
+
+    def serialize_settings(self) -> tuple:
+        """
+        Snapshot the current settings for write_settings().
+        Call on the thread that modifies settings; returns (seq, json_bytes).
+        """
+        data = serialization.dumps_indented_bytes(self.settings)
+        self._snapshot_seq += 1
+        return self._snapshot_seq, data
+
+    def write_settings(self, snapshot: tuple) -> bool:
+        """
+        Write a serialize_settings() snapshot atomically; verify; return True on success.
+        Safe to call from a worker thread. A snapshot older than the one
+        already written is skipped.
+        """
+        seq, data = snapshot
+        with self._write_lock:
+            if seq < self._written_seq:
+                return True
+            if self._write_file(data):
+                self._written_seq = seq
+                return True
+            return False
+
+    def _write_file(self, data: bytes) -> bool:
+        try:
             SETTINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
             tmp_path = SETTINGS_PATH.with_suffix(".tmp")
 
-            # 1) write tmp
-            with tmp_path.open("w", encoding="utf-8") as f:
-                json.dump(self.settings, f, indent=2)
+            # 1) write tmp (one buffered write)
+            with tmp_path.open("wb", buffering=1 << 18) as f:
+                f.write(data)
                 # 2) fsync to reduce Windows lock weirdness
                 try:
                     f.flush()
@@ -259,7 +317,7 @@ class SettingsManager:
 
             # 4) verify read-back (optional but recommended)
             try:
-                loaded = json.loads(SETTINGS_PATH.read_text(encoding="utf-8"))
+                loaded = serialization.loads(SETTINGS_PATH.read_bytes())
                 # minimal check: ensure it's a dict
                 if not isinstance(loaded, dict):
                     self.log_error("SettingsManager", "Settings saved but verification failed: invalid JSON structure")
@@ -295,6 +353,20 @@ class SettingsManager:
 
         return ok
 
+    def apply_runtime(self, keys=None) -> bool:
+        """
+        Re-apply live proxy and network settings after they change.
+        `keys` are the changed setting keys; only the appliers they affect run
+        (None = re-apply everything).
+        Returns True if WebEngine proxy flags changed (i.e., restart recommended).
+        """
+        restart = False
+        if keys is None or not self._PROXY_KEYS.isdisjoint(keys):
+            restart = self.apply_proxy_settings()
+        if keys is None or not self._NETWORK_KEYS.isdisjoint(keys):
+            self.apply_network_overrides()
+        return restart
+
     def apply_proxy_settings(self) -> bool:
         """
         Apply current proxy_* settings to the running process.
@@ -502,14 +574,26 @@ class SettingsManager:
         k = self._normalize_key(key)
         return self.settings.get(k, default)
 
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Shallow copy of all current settings, for callers that read many keys.
+        """
+        return dict(self.settings)
+
     def set(self, key: str, value, persist: bool = True):
         """
         Back-compat setter (QSettings-like). Supports 'a/b' keys.
         """
-        k = self._normalize_key(key)
-        self.settings[k] = value
-        if persist:
+        self.update({key: value}, persist=persist)
 
+    def update(self, mapping: Dict[str, Any], persist: bool = True) -> None:
+        """
+        Set several keys in one pass (values replace, no deep merge); saves at most once.
+        Supports 'a/b' keys like set().
+        """
+        normalize = self._normalize_key
+        self.settings.update({normalize(k): v for k, v in mapping.items()})
+        if persist:
             self.save_settings()
 
     def set_user_agent(self, ua: str) -> bool:
@@ -699,6 +783,9 @@ class SettingsManager:
 
     def apply_network_overrides(self) -> None:
         """Re-apply UA, language, and interceptor without recreating the profile."""
+        # Nothing to do until the profile exists; it reads current settings when built
+        if "web_profile" not in self.__dict__:
+            return
         if not isinstance(self.web_profile, QWebEngineProfile):
             return
 
@@ -1,18 +1,22 @@
 """Base command class for script commands."""
 
-from abc import ABC, abstractmethod
 
-
-class ScriptCommand(ABC):
-    """Abstract base class for all script commands.
+class ScriptCommand:
+    """Base class for all script commands.
     
     All concrete commands must:
     1. Implement execute() method
     2. Implement from_dict() class method (for deserialization)
     3. Implement to_dict() method (for serialization)
+    
+    Commands are small value objects created once per script line, so
+    subclasses declare __slots__ instead of carrying a per-instance dict.
+    The base is a plain class rather than an ABC to keep instantiation
+    cheap; missing methods raise NotImplementedError when called.
     """
     
-    @abstractmethod
+    __slots__ = ()
+    
     def execute(self, context):
         """Execute this command.
         
@@ -22,10 +26,9 @@ class ScriptCommand(ABC):
         Raises:
             RuntimeError: If command cannot be executed
         """
-        pass
+        raise NotImplementedError
     
     @classmethod
-    @abstractmethod
     def from_dict(cls, data: dict):
         """Create command instance from dictionary.
         
@@ -35,16 +38,15 @@ class ScriptCommand(ABC):
         Returns:
             ScriptCommand instance
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def to_dict(self) -> dict:
         """Convert command to dictionary for serialization.
         
         Returns:
             Dictionary with 'command' key and all parameters
         """
-        pass
+        raise NotImplementedError
     
     def __str__(self):
         """String representation for logging."""
@@ -10,10 +10,14 @@ from .save_text import SaveTextCommand
 from ..registry import CommandRegistry
 
 # Register all commands
-CommandRegistry.register('load_url', LoadURLCommand)
-CommandRegistry.register('pause', PauseCommand)
-CommandRegistry.register('save_html', SaveHTMLCommand)
-CommandRegistry.register('save_text', SaveTextCommand)
+_COMMANDS = {
+    'load_url': LoadURLCommand,
+    'pause': PauseCommand,
+    'save_html': SaveHTMLCommand,
+    'save_text': SaveTextCommand,
+}
+
+CommandRegistry.register_all(_COMMANDS)
 
 # Export command classes
 __all__ = [
@@ -11,6 +11,8 @@ class LoadURLCommand(ScriptCommand):
         wait_for_load (bool): Wait for page to load (default: True)
     """
     
+    __slots__ = ('url', 'wait_for_load')
+    
     def __init__(self, url: str, wait_for_load: bool = True):
         """Initialize LoadURL command.
         
@@ -36,92 +38,76 @@ class LoadURLCommand(ScriptCommand):
             raise RuntimeError("No browser window available")
         
         try:
-            context.log(f"Loading URL: {self.url}")
+            context.log("Loading URL: %s", self.url)
             
             # Navigate to URL
-            if hasattr(context.browser_window, 'tab_manager'):
-                # Use tab manager if available
-                context.browser_window.tab_manager.navigate_current(self.url)
-                
-                # Wait for page load if requested
-                if self.wait_for_load:
-                    self._wait_for_load(context)
-            else:
-                # Fallback
+            tab_manager = context.tab_manager
+            if tab_manager is None:
                 raise RuntimeError("Tab manager not available")
             
-            context.log(f"URL loaded successfully: {self.url}")
+            tab_manager.navigate_current(self.url)
+            
+            # Wait for page load if requested
+            if self.wait_for_load:
+                self._wait_for_load(context)
+            
+            context.log("URL loaded successfully: %s", self.url)
             
         except Exception as e:
             raise RuntimeError(f"Failed to load URL {self.url}: {e}")
     
     def _wait_for_load(self, context, timeout_ms=30000):
-        """Wait for current tab's page to finish loading and rendering.
+        """Wait for current tab's page to finish loading.
+        
+        Runs a local event loop that quits on loadFinished or on timeout,
+        so the wait wakes up as soon as the page is done.
         
         Args:
             context: ExecutionContext
             timeout_ms: Timeout in milliseconds (default 30 seconds)
         """
-        from PySide6.QtCore import QCoreApplication
+        if context.is_mock:
+            context.log("Mock browser detected - skipping wait logic")
+            return
         
-        tab = context.browser_window.tab_manager.get_current_tab()
+        from PySide6.QtCore import QEventLoop, QTimer
+        
+        tab = context.tab_manager.get_current_tab()
         if not tab or not tab.view:
             context.log("No tab available for load wait", level="WARNING")
             return
         
-        # Check if this is a mock view by checking the type of loadFinished
-        try:
-            signal = tab.view.loadFinished
-            # Real Qt signals are of type PySide6.QtCore.Signal
-            # Mock signals are of type MockSignal
-            if signal.__class__.__name__ == 'MockSignal':
-                context.log("Mock browser detected - skipping wait logic")
-                return
-        except Exception:
-            pass
-        
         try:
             # Track load state
             load_finished = False
             load_success = False
+            loop = QEventLoop()
             
             def on_load_finished(ok):
                 nonlocal load_finished, load_success
                 load_finished = True
                 load_success = ok
-                context.log(f"Page load finished (success={ok})")
+                context.log("Page load finished (success=%s)", ok)
+                loop.quit()
             
-            # Connect load finished signal
             tab.view.loadFinished.connect(on_load_finished)
             
-            # Poll for completion instead of using nested event loop
-            # This keeps the main event loop running properly for QWebEngineView's render process
-            context.log(f"Waiting for page load (max {timeout_ms}ms)...")
+            timer = QTimer()
+            timer.setSingleShot(True)
+            timer.timeout.connect(loop.quit)
             
-            import time
-            elapsed_ms = 0
-            poll_interval_ms = 50
+            context.log("Waiting for page load (max %sms)...", timeout_ms)
+            timer.start(timeout_ms)
+            loop.exec()
+            timer.stop()
             
-            while not load_finished and elapsed_ms < timeout_ms:
-                # Process events to allow render process communication
-                QCoreApplication.processEvents()
-                time.sleep(poll_interval_ms / 1000.0)
-                elapsed_ms += poll_interval_ms
-            
-            # Disconnect signal
             tab.view.loadFinished.disconnect(on_load_finished)
             
             if not load_finished:
                 context.log("Page load timeout - continuing anyway", level="WARNING")
             
-            # Give render process additional time to complete painting
-            context.log("Allowing render process to complete painting...")
-            for i in range(20):
-                QCoreApplication.processEvents()
-                time.sleep(0.05)  # 50ms between each cycle
-            
         except Exception as e:
-            context.log(f"Error during page load wait: {e}", level="WARNING")
+            context.log("Error during page load wait: %s", e, level="WARNING")
     
     @classmethod
     def from_dict(cls, data: dict):
@@ -11,6 +11,8 @@ class PauseCommand(ScriptCommand):
         seconds (float): Number of seconds to pause (must be positive)
     """
     
+    __slots__ = ('seconds',)
+    
     def __init__(self, seconds: float):
         """Initialize Pause command.
         
@@ -20,9 +22,11 @@ class PauseCommand(ScriptCommand):
         Raises:
             ValueError: If seconds is negative
         """
+        if seconds.__class__ is not float:
+            seconds = float(seconds)
         if seconds < 0:
             raise ValueError("Seconds must be non-negative")
-        self.seconds = float(seconds)
+        self.seconds = seconds
     
     def execute(self, context):
         """Execute the command.
@@ -31,12 +35,36 @@ class PauseCommand(ScriptCommand):
             context: ExecutionContext
         """
         if self.seconds > 0:
-            context.log(f"Pausing for {self.seconds} seconds...")
-            time.sleep(self.seconds)
-            context.log(f"Pause complete")
+            context.log("Pausing for %s seconds...", self.seconds)
+            self._wait(self.seconds)
+            context.log("Pause complete")
         else:
             context.log("Pause duration is 0 seconds")
     
+    @staticmethod
+    def _wait(seconds: float):
+        """Wait without blocking the Qt event loop.
+        
+        Pending page loads, painting and network callbacks keep being
+        processed during the pause. Falls back to time.sleep() when no
+        Qt application is running.
+        
+        Args:
+            seconds: Seconds to wait
+        """
+        try:
+            from PySide6.QtCore import QCoreApplication, QEventLoop, QTimer
+        except ImportError:
+            QCoreApplication = None
+        
+        if QCoreApplication is None or QCoreApplication.instance() is None:
+            time.sleep(seconds)
+            return
+        
+        loop = QEventLoop()
+        QTimer.singleShot(int(seconds * 1000), loop.quit)
+        loop.exec()
+    
     @classmethod
     def from_dict(cls, data: dict):
         """Create from dictionary.
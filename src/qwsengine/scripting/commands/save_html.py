@@ -1,8 +1,7 @@
 """Save HTML command with timestamp."""
 
-from pathlib import Path
-from datetime import datetime
 from ..command import ScriptCommand
+from ..utils import write_text_file, fetch_page_content, sanitize_tag, timestamped_filename
 
 
 class SaveHTMLCommand(ScriptCommand):
@@ -20,6 +19,8 @@ class SaveHTMLCommand(ScriptCommand):
         folder (str): Output folder (from settings if not provided)
     """
     
+    __slots__ = ('tag', 'folder')
+    
     def __init__(self, tag: str = None, folder: str = None):
         """Initialize SaveHTML command.
         
@@ -40,19 +41,7 @@ class SaveHTMLCommand(ScriptCommand):
         Returns:
             Sanitized tag safe for filenames
         """
-        if not tag:
-            return None
-        
-        # Replace spaces with underscores
-        tag = tag.strip().replace(' ', '_')
-        
-        # Remove any characters that aren't alphanumeric or underscore
-        tag = ''.join(c for c in tag if c.isalnum() or c == '_')
-        
-        # Remove leading/trailing underscores
-        tag = tag.strip('_')
-        
-        return tag if tag else None
+        return sanitize_tag(tag)
     
     @staticmethod
     def _generate_filename(tag: str = None) -> str:
@@ -64,14 +53,7 @@ class SaveHTMLCommand(ScriptCommand):
         Returns:
             Filename like: 20251222185623.456.html or 20251222185623.456_panda.html
         """
-        now = datetime.now()
-        timestamp = now.strftime('%Y%m%d%H%M%S')
-        milliseconds = now.microsecond // 1000
-        
-        if tag:
-            return f"{timestamp}.{milliseconds:03d}_{tag}.html"
-        else:
-            return f"{timestamp}.{milliseconds:03d}.html"
+        return timestamped_filename('html', tag)
     
     def execute(self, context):
         """Execute the command.
@@ -93,21 +75,23 @@ class SaveHTMLCommand(ScriptCommand):
             else:
                 folder = folder or "./output/captures"
             
-            # Generate filename
-            filename = self._generate_filename(self.tag)
-            
             # Create output directory if needed
-            output_dir = Path(folder)
-            output_dir.mkdir(parents=True, exist_ok=True)
+            output_dir = context.ensure_dir(folder)
             
-            # Get HTML and save
+            # Get HTML
             html = self._extract_html(context)
-            filepath = output_dir / filename
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html)
+            # Generate filename and save, skipping the write if that file
+            # was just saved with identical content
+            filepath = output_dir / self._generate_filename(self.tag)
+            if context.is_duplicate_save(filepath, html):
+                context.log("save_html: unchanged, skipped %s", filepath)
+                return
+            
+            write_text_file(filepath, html)
+            context.record_save(filepath, html)
             
-            context.log(f"Saved HTML to: {filepath}")
+            context.log("Saved HTML to: %s", filepath)
             
         except Exception as e:
             raise RuntimeError(f"Failed to save HTML: {e}")
@@ -121,51 +105,23 @@ class SaveHTMLCommand(ScriptCommand):
         Returns:
             HTML content as string
         """
-        from PySide6.QtCore import QEventLoop
+        page = context.current_page()
         
-        # Get current tab
-        tab = None
-        if hasattr(context.browser_window, 'tab_manager'):
-            tab = context.browser_window.tab_manager.get_current_tab()
+        # Already fetched for this page (see ScriptExecutor._prefetch_saves)
+        html = context.get_page_content(page, 'html')
+        if html is not None:
+            return html
         
-        if not tab or not hasattr(tab, 'view') or not tab.view:
-            raise RuntimeError("No active tab or browser view available")
-        
-        page = tab.view.page()
-        if not page:
-            raise RuntimeError("No page available")
-        
-        # Try to get HTML synchronously first (works for mock views)
-        try:
-            html = page.toHtml()
-            # Check if it's a string (mock) or a future/callable (real)
-            if isinstance(html, str):
-                return html
-        except Exception:
-            pass
+        # Mock views return HTML synchronously
+        if context.is_mock:
+            return page.toHtml()
         
         # For real QWebEnginePage, toHtml() requires a callback
-        html_content = []
-        
-        def handle_html(html):
-            """Callback to receive HTML content."""
-            html_content.append(html)
-            loop.quit()
-        
         try:
-            # Create loop first so callback can reference it
-            loop = QEventLoop()
-            
-            # Request HTML with callback
-            page.toHtml(handle_html)
-            
-            # Run event loop until callback receives the HTML
-            loop.exec()
-            
-            # Return the collected HTML or empty string if nothing was collected
-            return html_content[0] if html_content else ""
+            html, _ = fetch_page_content(page)
+            return html or ""
         except Exception as e:
-            context.log(f"Error extracting HTML: {e}", level="WARNING")
+            context.log("Error extracting HTML: %s", e, level="WARNING")
             return ""
     
     @classmethod
@@ -1,8 +1,10 @@
 """Save Text command with timestamp."""
 
-from pathlib import Path
-from datetime import datetime
 from ..command import ScriptCommand
+from ..utils import write_text_file, fetch_page_content, sanitize_tag, timestamped_filename
+
+# JavaScript to extract page text (evaluated as an expression, so no 'return')
+INNER_TEXT_JS = "document.documentElement.innerText"
 
 
 class SaveTextCommand(ScriptCommand):
@@ -22,6 +24,8 @@ class SaveTextCommand(ScriptCommand):
         folder (str): Output folder (from settings if not provided)
     """
     
+    __slots__ = ('tag', 'folder')
+    
     def __init__(self, tag: str = None, folder: str = None):
         """Initialize SaveText command.
         
@@ -42,19 +46,7 @@ class SaveTextCommand(ScriptCommand):
         Returns:
             Sanitized tag safe for filenames
         """
-        if not tag:
-            return None
-        
-        # Replace spaces with underscores
-        tag = tag.strip().replace(' ', '_')
-        
-        # Remove any characters that aren't alphanumeric or underscore
-        tag = ''.join(c for c in tag if c.isalnum() or c == '_')
-        
-        # Remove leading/trailing underscores
-        tag = tag.strip('_')
-        
-        return tag if tag else None
+        return sanitize_tag(tag)
     
     @staticmethod
     def _generate_filename(tag: str = None) -> str:
@@ -66,14 +58,7 @@ class SaveTextCommand(ScriptCommand):
         Returns:
             Filename like: 20251222185623.456.txt or 20251222185623.456_results.txt
         """
-        now = datetime.now()
-        timestamp = now.strftime('%Y%m%d%H%M%S')
-        milliseconds = now.microsecond // 1000
-        
-        if tag:
-            return f"{timestamp}.{milliseconds:03d}_{tag}.txt"
-        else:
-            return f"{timestamp}.{milliseconds:03d}.txt"
+        return timestamped_filename('txt', tag)
     
     def execute(self, context):
         """Execute the command.
@@ -99,17 +84,15 @@ class SaveTextCommand(ScriptCommand):
             filename = self._generate_filename(self.tag)
             
             # Create output directory if needed
-            output_dir = Path(folder)
-            output_dir.mkdir(parents=True, exist_ok=True)
+            output_dir = context.ensure_dir(folder)
             
             # Get text and save
             text = self._extract_text(context)
             filepath = output_dir / filename
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(text)
+            write_text_file(filepath, text)
             
-            context.log(f"Saved TEXT to: {filepath}")
+            context.log("Saved TEXT to: %s", filepath)
             
         except Exception as e:
             raise RuntimeError(f"Failed to save text: {e}")
@@ -125,45 +108,23 @@ class SaveTextCommand(ScriptCommand):
         Returns:
             Text content as string
         """
-        from PySide6.QtCore import QEventLoop
+        page = context.current_page()
         
-        # Get current tab
-        tab = None
-        if hasattr(context.browser_window, 'tab_manager'):
-            tab = context.browser_window.tab_manager.get_current_tab()
+        # Already fetched for this page (see ScriptExecutor._prefetch_saves)
+        text = context.get_page_content(page, 'text')
+        if text is not None:
+            return text
         
-        if not tab or not hasattr(tab, 'view') or not tab.view:
-            raise RuntimeError("No active tab or browser view available")
-        
-        page = tab.view.page()
-        if not page:
-            raise RuntimeError("No page available")
-        
-        text_content = []
-        
-        def handle_text(text):
-            """Callback to receive text content."""
-            text_content.append(text)
-            loop.quit()
+        # Mock views can't run JavaScript and have no rendered text
+        if context.is_mock:
+            return ""
         
         try:
-            # JavaScript to extract page text
-            script = "return document.documentElement.innerText;"
-            
-            # Create loop first so callback can reference it
-            loop = QEventLoop()
-            
-            # Run JavaScript
-            page.runJavaScript(script, handle_text)
-            
-            # Run event loop until callback receives the text
-            loop.exec()
-            
-            # Return the collected text
-            return text_content[0] if text_content else ""
+            _, text = fetch_page_content(page, html=False, text_script=INNER_TEXT_JS)
+            return text or ""
         
         except Exception as e:
-            context.log(f"Error extracting text: {e}", level="WARNING")
+            context.log("Error extracting text: %s", e, level="WARNING")
             return ""
     
     @classmethod
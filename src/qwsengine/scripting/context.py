@@ -1,6 +1,10 @@
 """Execution context - passed to commands, provides utilities."""
 
-from datetime import datetime
+import os
+import sys
+import time
+from collections import deque
+from pathlib import Path
 
 
 class ExecutionContext:
@@ -13,45 +17,266 @@ class ExecutionContext:
     - Execution state
     """
     
-    def __init__(self, browser_window=None, settings_manager=None):
+    def __init__(self, browser_window=None, settings_manager=None,
+                 log_history: int = 10_000):
         """Initialize execution context.
         
         Args:
             browser_window: Reference to BrowserWindow
             settings_manager: Reference to SettingsManager
+            log_history: Maximum number of log entries kept in memory;
+                the oldest are dropped first (None for no limit)
         """
         self.browser_window = browser_window
         self.settings_manager = settings_manager
         
+        # Resolved once: the browser window is fixed for the whole run
+        self.tab_manager = getattr(browser_window, 'tab_manager', None)
+        # Mock browsers (headless tests) mark themselves with is_mock = True
+        self.is_mock = bool(getattr(browser_window, 'is_mock', False))
+        
         # Execution control
         self.stop_on_error = False
         self.pause_on_error = False
         
-        # Logging
-        self.logs = []
+        # Logging: entries are (level, timestamp, message, args) tuples,
+        # formatted only when read. Console output is buffered and written
+        # in batches of log_flush_threshold lines, or on flush_logs().
+        self.logs = deque(maxlen=log_history)
         self.log_to_console = True
+        self.log_flush_threshold = 64
+        self._console_pending = []
+        # '[HH:MM:SS] [LEVEL] ' prefixes for the last formatted second,
+        # by level; rebuilt when entries move on to a new second
+        self._ts_second = None
+        self._ts_text = ""
+        self._log_prefixes = {}
+        
+        # Shared HTTP client, created on first use (see http)
+        self._http = None
+        
+        # Output directories already created during this run, by absolute
+        # path, and the Path returned for each folder value seen so far
+        self._ensured_dirs = set()
+        self._dir_paths = {}
+        # Hash of the last content saved per (output dir, tag) key
+        self._last_save_hash = {}
+        
+        # Page content ('html'/'text') prefetched by the executor for a run
+        # of consecutive save commands; only valid for _content_page
+        self._page_content = {}
+        self._content_page = None
+    
+    @property
+    def http(self):
+        """Shared QNetworkAccessManager for commands that fetch over HTTP.
+        
+        Created on first use and reused for the whole run, so repeated
+        requests to the same host share pooled keep-alive connections.
+        """
+        if self._http is None:
+            from PySide6.QtNetwork import QNetworkAccessManager
+            self._http = QNetworkAccessManager()
+        return self._http
+    
+    def close(self):
+        """Release resources held by the context."""
+        if self._http is not None:
+            self._http.clearConnectionCache()
+            self._http.deleteLater()
+            self._http = None
+    
+    def current_page(self):
+        """Get the page shown in the current tab.
+        
+        Returns:
+            Current page object
+        
+        Raises:
+            RuntimeError: If there is no tab, view or page
+        """
+        tab = self.tab_manager.get_current_tab() if self.tab_manager else None
+        view = getattr(tab, 'view', None)
+        if not view:
+            raise RuntimeError("No active tab or browser view available")
+        
+        page = view.page()
+        if not page:
+            raise RuntimeError("No page available")
+        return page
+    
+    def ensure_dir(self, path) -> Path:
+        """Create a directory (and parents) once per run.
+        
+        Repeated calls for the same directory skip the filesystem entirely,
+        and repeated calls with the same value also reuse the Path built
+        the first time. Directories are keyed by their absolute form, so
+        'out' and './out' share an entry (os.path.abspath is pure string
+        work, unlike resolve()).
+        
+        Args:
+            path: Directory path
+        
+        Returns:
+            The directory as a Path
+        """
+        directory = self._dir_paths.get(path)
+        if directory is not None:
+            return directory
+        
+        directory = Path(path)
+        key = os.path.abspath(directory)
+        if key not in self._ensured_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(key)
+        self._dir_paths[path] = directory
+        return directory
+    
+    def is_duplicate_save(self, key, content: str) -> bool:
+        """Check whether content matches the last successful save under key.
+        
+        Empty content is never treated as a duplicate.
+        
+        Args:
+            key: Hashable identifier of the save target
+            content: Content about to be written
+        
+        Returns:
+            True if the last save recorded under key had identical content
+        """
+        if not content:
+            return False
+        return self._last_save_hash.get(key) == hash(content)
+    
+    def record_save(self, key, content: str):
+        """Remember content as the last successful save under key.
+        
+        Call after the write succeeded; see is_duplicate_save().
+        
+        Args:
+            key: Hashable identifier of the save target
+            content: Content that was written
+        """
+        if content:
+            self._last_save_hash[key] = hash(content)
+    
+    def set_page_content(self, page, **content):
+        """Cache fetched content for page until it navigates.
+        
+        Replaces any previously cached content. The cache is dropped when
+        the page starts loading something else.
+        
+        Args:
+            page: Page the content was read from
+            **content: Content by kind, e.g. html=..., text=...
+        """
+        self.clear_page_content()
+        self._page_content.update(
+            (kind, value) for kind, value in content.items() if value is not None
+        )
+        self._content_page = page
+        if hasattr(page, 'loadStarted'):
+            page.loadStarted.connect(self.clear_page_content)
+    
+    def get_page_content(self, page, kind: str):
+        """Get cached content for page.
+        
+        Args:
+            page: Page being saved
+            kind: 'html' or 'text'
+        
+        Returns:
+            Cached string, or None if nothing is cached for this page
+        """
+        if page is not self._content_page:
+            return None
+        return self._page_content.get(kind)
+    
+    def clear_page_content(self):
+        """Drop cached page content."""
+        page = self._content_page
+        if page is not None:
+            self._content_page = None
+            if hasattr(page, 'loadStarted'):
+                try:
+                    page.loadStarted.disconnect(self.clear_page_content)
+                except (RuntimeError, TypeError):
+                    pass
+        self._page_content.clear()
     
-    def log(self, message: str, level: str = "INFO"):
+    def reset(self):
+        """Forget per-run caches (created directories, save hashes)."""
+        self._ensured_dirs.clear()
+        self._dir_paths.clear()
+        self._last_save_hash.clear()
+        self.clear_page_content()
+    
+    def log(self, message: str, *args, level: str = "INFO"):
         """Log a message.
         
+        Formatting is deferred: pass %-style placeholders and their values
+        as args, e.g. context.log("Loading URL: %s", url).
+        
         Args:
-            message: Message to log
+            message: Message to log, optionally with %-style placeholders
+            *args: Values for the placeholders
             level: Log level (INFO, WARNING, ERROR)
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] [{level}] {message}"
-        self.logs.append(log_entry)
+        entry = (level, time.time(), message, args)
+        self.logs.append(entry)
         
         if self.log_to_console:
-            print(log_entry)
+            self._console_pending.append(entry)
+            if len(self._console_pending) >= self.log_flush_threshold:
+                self.flush_logs()
+    
+    def _format_entry(self, entry) -> str:
+        """Format a log entry as '[HH:MM:SS] [LEVEL] message'."""
+        level, timestamp, message, args = entry
+        if args:
+            try:
+                message = message % args
+            except (TypeError, ValueError):
+                # Placeholders don't match the args; keep both visible
+                message = f"{message} {args!r}"
+        
+        # strftime only runs when the second changes
+        second = int(timestamp)
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_text = time.strftime('%H:%M:%S', time.localtime(second))
+            self._log_prefixes.clear()
+        
+        prefix = self._log_prefixes.get(level)
+        if prefix is None:
+            prefix = self._log_prefixes[level] = f"[{self._ts_text}] [{level}] "
+        return prefix + message
+    
+    def flush_logs(self, file=None):
+        """Write buffered console log lines in a single batch.
+        
+        Args:
+            file: Stream to write to (default: sys.stdout)
+        """
+        if not self._console_pending:
+            return
+        
+        file = file or sys.stdout
+        try:
+            file.writelines(
+                self._format_entry(entry) + "\n" for entry in self._console_pending
+            )
+            file.flush()
+        finally:
+            self._console_pending.clear()
     
     def get_logs(self) -> list:
         """Get all logged messages.
         
         Returns:
-            List of log entries
+            List of formatted log entries
         """
-        return self.logs.copy()
+        return [self._format_entry(entry) for entry in self.logs]
     
     def clear_logs(self):
         """Clear log history."""
@@ -1,9 +1,49 @@
 """Script executor - orchestrates command execution."""
 
-import time
+import json
+import threading
+from pathlib import Path
 from typing import Callable
 
 from .registry import CommandRegistry
+from .context import ExecutionContext
+from .utils import fetch_page_content
+from .commands.save_html import SaveHTMLCommand
+from .commands.save_text import SaveTextCommand, INNER_TEXT_JS
+
+# Commands that only read the current page; consecutive runs share one fetch
+_SAVE_TYPES = (SaveHTMLCommand, SaveTextCommand)
+
+
+def _validate_script(json_data) -> dict:
+    """Validate the structure of a script document in a single pass.
+    
+    Checks the envelope and that every entry names a command. Command
+    parameters are validated by each command's from_dict().
+    
+    Args:
+        json_data: Parsed script document
+        
+    Returns:
+        Dict mapping command index to error message for malformed entries
+        
+    Raises:
+        ValueError: If the document itself is malformed
+    """
+    if not isinstance(json_data, dict) or 'commands' not in json_data:
+        raise ValueError("JSON must contain 'commands' key")
+    
+    commands = json_data['commands']
+    if not isinstance(commands, list):
+        raise ValueError("'commands' must be a list")
+    
+    invalid = {}
+    for i, cmd_data in enumerate(commands):
+        if not isinstance(cmd_data, dict):
+            invalid[i] = f"Command {i} must be an object, got {type(cmd_data).__name__}"
+        elif not isinstance(cmd_data.get('command'), str):
+            invalid[i] = f"Command {i} missing 'command' key"
+    return invalid
 
 
 class ScriptExecutor:
@@ -15,6 +55,10 @@ class ScriptExecutor:
     - Handle errors (stop or continue)
     - Pause/resume execution
     - Progress tracking
+    
+    Commands run strictly in order: they all act on the browser's current
+    tab, so a save_* command depends on the page left by the preceding
+    load_url. Independent page loads are not fanned out concurrently.
     """
     
     def __init__(self, context=None):
@@ -23,13 +67,18 @@ class ScriptExecutor:
         Args:
             context: ExecutionContext (will create default if None)
         """
-        from .context import ExecutionContext
         self.context = context or ExecutionContext()
         self.commands = []
+        self._descriptions = []
         self.current_index = 0
         self.is_running = False
         self.is_paused = False
         self.errors = []
+        
+        # Set while execution may proceed; pause() clears it so the
+        # executing thread blocks until resume() or stop()
+        self._run_gate = threading.Event()
+        self._run_gate.set()
     
     def load_from_json(self, json_data: dict):
         """Load script from JSON data.
@@ -43,22 +92,86 @@ class ScriptExecutor:
         self.commands = []
         self.errors = []
         
-        if 'commands' not in json_data:
-            raise ValueError("JSON must contain 'commands' key")
+        invalid = _validate_script(json_data)
+        
+        # Resolve each command name through the registry once per script,
+        # and build identical command entries (e.g. repeated pauses) once
+        command_classes = {}
+        built = {}
+        append = self.commands.append
         
         for i, cmd_data in enumerate(json_data['commands']):
             try:
-                if 'command' not in cmd_data:
-                    raise ValueError(f"Command {i} missing 'command' key")
+                if i in invalid:
+                    raise ValueError(invalid[i])
+                
+                try:
+                    key = tuple(sorted(cmd_data.items()))
+                    command = built.get(key)
+                except TypeError:
+                    # Unhashable parameter values: build every time
+                    key = command = None
                 
-                command_name = cmd_data['command']
-                cmd = CommandRegistry.create_command(command_name, cmd_data)
-                self.commands.append(cmd)
+                if command is None:
+                    command_name = cmd_data['command']
+                    command_class = command_classes.get(command_name)
+                    if command_class is None:
+                        command_class = CommandRegistry.get(command_name)
+                        if command_class is None:
+                            # Raises the registry's unknown-command error
+                            CommandRegistry.create_command(command_name, cmd_data)
+                        command_classes[command_name] = command_class
+                    command = command_class.from_dict(cmd_data)
+                    if key is not None:
+                        built[key] = command
+                append(command)
                 
             except Exception as e:
                 error = f"Error loading command {i}: {e}"
                 self.errors.append(error)
                 self.context.log(error, level="ERROR")
+        
+        self._descriptions = [str(cmd) for cmd in self.commands]
+    
+    def _prefetch_saves(self, start: int) -> int:
+        """Fetch page content once for a run of consecutive save commands.
+        
+        Saves in a run all read the same page, so their toHtml() and
+        innerText requests are submitted together and awaited in a single
+        event loop. Results are cached on the context for that page, where
+        the save commands pick them up.
+        
+        Args:
+            start: Index of the first save command in the run
+            
+        Returns:
+            Index just past the end of the run
+        """
+        commands = self.commands
+        end = start
+        want_html = want_text = False
+        while end < len(commands) and type(commands[end]) in _SAVE_TYPES:
+            if type(commands[end]) is SaveTextCommand:
+                want_text = True
+            else:
+                want_html = True
+            end += 1
+        
+        # A single save gains nothing; mock pages answer synchronously
+        if end - start < 2 or self.context.is_mock:
+            return end
+        
+        try:
+            page = self.context.current_page()
+            html, text = fetch_page_content(
+                page, want_html, INNER_TEXT_JS if want_text else None
+            )
+        except Exception as e:
+            self.context.log("Prefetch failed, saving individually: %s", e, level="WARNING")
+            return end
+        
+        self.context.set_page_content(page, html=html, text=text)
+        return end
     
     def load_from_file(self, filepath: str):
         """Load script from file (auto-detects format).
@@ -74,17 +187,14 @@ class ScriptExecutor:
             FileNotFoundError: If file not found
             ValueError: If format is invalid
         """
-        import json
-        from pathlib import Path
-        
         try:
             file_path = Path(filepath)
             extension = file_path.suffix.lower()
             
             if extension == '.json':
-                # JSON format
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    json_data = json.load(f)
+                # JSON format: read raw bytes in one call and let the json
+                # module decode them, skipping the text-mode layer
+                json_data = json.loads(file_path.read_bytes())
                 self.load_from_json(json_data)
             else:
                 # Simple format (.script, .txt, or other)
@@ -96,13 +206,11 @@ class ScriptExecutor:
                     except ImportError:
                         raise ImportError("simple_parser module not found")
                 
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    text = f.read()
-                
+                text = file_path.read_text(encoding='utf-8')
                 json_data = parse_simple_script(text)
                 self.load_from_json(json_data)
             
-            self.context.log(f"Loaded script from: {filepath}")
+            self.context.log("Loaded script from: %s", filepath)
             
         except FileNotFoundError:
             raise FileNotFoundError(f"Script file not found: {filepath}")
@@ -111,20 +219,40 @@ class ScriptExecutor:
         except ValueError as e:
             raise ValueError(f"Invalid script format in {filepath}: {e}")
     
-    def save_to_file(self, filepath: str):
+    def save_to_file(self, filepath: str, pretty: bool = True):
         """Save current script to JSON file.
         
+        Commands are serialized and written one at a time through a large
+        write buffer, so no copy of the whole script is built in memory.
+        
         Args:
             filepath: Path where to save file
+            pretty: Indent the output as json.dump(indent=2) would;
+                write compact JSON if False
         """
-        import json
-        script_data = {
-            'version': '1.0',
-            'commands': [cmd.to_dict() for cmd in self.commands]
-        }
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(script_data, f, indent=2)
-        self.context.log(f"Saved script to: {filepath}")
+        if pretty:
+            head = '{\n  "version": "1.0",\n  "commands": ['
+            tail = '\n  ]\n}' if self.commands else ']\n}'
+            
+            def encode(data):
+                # JSON strings never contain raw newlines, so re-indenting
+                # the nested document line by line is safe
+                return '\n    ' + json.dumps(data, indent=2).replace('\n', '\n    ')
+        else:
+            head = '{"version":"1.0","commands":['
+            tail = ']}'
+            
+            def encode(data):
+                return json.dumps(data, separators=(',', ':'))
+        
+        with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(head)
+            for i, cmd in enumerate(self.commands):
+                if i:
+                    f.write(',')
+                f.write(encode(cmd.to_dict()))
+            f.write(tail)
+        self.context.log("Saved script to: %s", filepath)
     
     def execute(self, on_progress: Callable = None) -> bool:
         """Execute all commands sequentially.
@@ -138,7 +266,20 @@ class ScriptExecutor:
         self.is_running = True
         self.errors = []
         
-        self.context.log(f"Starting script execution ({len(self.commands)} commands)")
+        total = len(self.commands)
+        # Descriptions are built once at load time; rebuild only if the
+        # command list was changed directly since then
+        if len(self._descriptions) != total:
+            self._descriptions = [str(cmd) for cmd in self.commands]
+        descriptions = self._descriptions
+        
+        context = self.context
+        log = context.log
+        log("Starting script execution (%d commands)", total)
+        
+        save_run_end = 0
+        clear_page_content = context.clear_page_content
+        clear_page_content()
         
         success_count = 0
         error_count = 0
@@ -147,59 +288,71 @@ class ScriptExecutor:
             self.current_index = i
             
             # Handle pause/resume
-            while self.is_paused and self.is_running:
-                time.sleep(0.1)
+            self._run_gate.wait()
             
             # Check for stop request
             if not self.is_running:
-                self.context.log("Script execution stopped by user")
+                log("Script execution stopped by user")
                 break
             
+            description = descriptions[i]
             try:
                 # Update progress
-                if on_progress:
-                    on_progress(i, len(self.commands), str(cmd))
+                if on_progress is not None:
+                    on_progress(i, total, description)
+                
+                # Fetch page content once per run of save commands
+                if type(cmd) in _SAVE_TYPES:
+                    if i >= save_run_end:
+                        save_run_end = self._prefetch_saves(i)
+                else:
+                    clear_page_content()
                 
                 # Execute command
-                self.context.log(f"Executing [{i+1}/{len(self.commands)}]: {cmd}")
-                cmd.execute(self.context)
+                log("Executing [%d/%d]: %s", i + 1, total, description)
+                cmd.execute(context)
                 success_count += 1
                 
             except Exception as e:
-                error_msg = f"Command failed: {e}"
                 error_count += 1
                 self.errors.append((i, cmd, str(e)))
-                self.context.log(error_msg, level="ERROR")
+                log("Command failed: %s", e, level="ERROR")
                 
                 # Check error handling mode
-                if self.context.stop_on_error:
-                    self.context.log("Stopping on error")
+                if context.stop_on_error:
+                    log("Stopping on error")
                     break
         
         self.is_running = False
+        clear_page_content()
         
         # Summary
-        self.context.log(
-            f"Script execution complete: {success_count} succeeded, "
-            f"{error_count} failed"
+        log(
+            "Script execution complete: %d succeeded, %d failed",
+            success_count, error_count
         )
+        context.flush_logs()
         
         return error_count == 0
     
     def pause(self):
         """Pause script execution."""
         self.is_paused = True
+        self._run_gate.clear()
         self.context.log("Script paused")
     
     def resume(self):
         """Resume script execution."""
         self.is_paused = False
+        self._run_gate.set()
         self.context.log("Script resumed")
     
     def stop(self):
         """Stop script execution."""
         self.is_running = False
+        self._run_gate.set()
         self.context.log("Script stopped")
+        self.context.flush_logs()
     
     def get_progress(self) -> tuple:
         """Get current execution progress.
@@ -1,5 +1,10 @@
 """Command registry - central place to register and retrieve commands."""
 
+import logging
+from functools import lru_cache
+
+_log = logging.getLogger(__name__)
+
 
 class CommandRegistry:
     """Registry for available script commands.
@@ -11,23 +16,69 @@ class CommandRegistry:
     """
     
     _registry = {}
+    # Name -> bound from_dict, kept in step with _registry so
+    # create_command() dispatches without resolving the method each time
+    _factories = {}
+    # Sorted command names, rebuilt on demand after the registry changes
+    _sorted_names = None
     
     @classmethod
     def register(cls, command_name: str, command_class):
         """Register a command class.
         
+        Registering the same class again under the same name is a no-op.
+        
         Args:
             command_name: Name of command (e.g., 'load_url')
             command_class: Class implementing ScriptCommand
+            
+        Raises:
+            ValueError: If the name is bound to a different class
         """
-        if command_name in cls._registry:
+        existing = cls._registry.get(command_name)
+        if existing is command_class:
+            return
+        if existing is not None:
             raise ValueError(f"Command already registered: {command_name}")
         
         if not hasattr(command_class, 'from_dict'):
             raise ValueError(f"Command must implement from_dict: {command_name}")
         
         cls._registry[command_name] = command_class
-        print(f"[Registry] Registered command: {command_name}")
+        cls._factories[command_name] = command_class.from_dict
+        cls._lookup.cache_clear()
+        cls._sorted_names = None
+        _log.debug("Registered command: %s", command_name)
+    
+    @classmethod
+    def register_all(cls, commands: dict):
+        """Register several command classes in one step.
+        
+        The whole mapping is validated first, then merged with a single
+        dict update, so a bad entry leaves the registry untouched.
+        
+        Args:
+            commands: Mapping of command name -> command class
+            
+        Raises:
+            ValueError: If a name is bound to a different class or a
+                class does not implement from_dict
+        """
+        for command_name, command_class in commands.items():
+            existing = cls._registry.get(command_name)
+            if existing is not None and existing is not command_class:
+                raise ValueError(f"Command already registered: {command_name}")
+            if not hasattr(command_class, 'from_dict'):
+                raise ValueError(f"Command must implement from_dict: {command_name}")
+        
+        cls._registry.update(commands)
+        cls._factories.update(
+            (command_name, command_class.from_dict)
+            for command_name, command_class in commands.items()
+        )
+        cls._lookup.cache_clear()
+        cls._sorted_names = None
+        _log.debug("Registered commands: %s", ", ".join(commands))
     
     @classmethod
     def unregister(cls, command_name: str):
@@ -38,7 +89,10 @@ class CommandRegistry:
         """
         if command_name in cls._registry:
             del cls._registry[command_name]
-            print(f"[Registry] Unregistered command: {command_name}")
+            del cls._factories[command_name]
+            cls._lookup.cache_clear()
+            cls._sorted_names = None
+            _log.debug("Unregistered command: %s", command_name)
     
     @classmethod
     def get(cls, command_name: str):
@@ -50,7 +104,13 @@ class CommandRegistry:
         Returns:
             Command class or None if not found
         """
-        return cls._registry.get(command_name)
+        return cls._lookup(command_name)
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _lookup(command_name: str):
+        """Cached name -> class resolution (cleared on register/unregister)."""
+        return CommandRegistry._registry.get(command_name)
     
     @classmethod
     def list_commands(cls) -> list:
@@ -59,7 +119,9 @@ class CommandRegistry:
         Returns:
             List of command names
         """
-        return sorted(list(cls._registry.keys()))
+        if cls._sorted_names is None:
+            cls._sorted_names = tuple(sorted(cls._registry))
+        return list(cls._sorted_names)
     
     @classmethod
     def create_command(cls, command_name: str, data: dict):
@@ -75,14 +137,14 @@ class CommandRegistry:
         Raises:
             ValueError: If command not found
         """
-        command_class = cls.get(command_name)
-        if not command_class:
+        factory = cls._factories.get(command_name)
+        if factory is None:
             available = cls.list_commands()
             raise ValueError(
                 f"Unknown command: {command_name}\n"
                 f"Available commands: {', '.join(available)}"
             )
-        return command_class.from_dict(data)
+        return factory(data)
     
     @classmethod
     def is_registered(cls, command_name: str) -> bool:
@@ -9,11 +9,226 @@ Simple Format Examples:
     SAVE TEXT results
 """
 
+import re
 from typing import List, Dict, Tuple
 
+# One token: a run of quoted segments and non-space characters. An
+# unterminated quote runs to the end of the line. Quotes are removed
+# afterwards, so 'a"b c"d' yields the single token 'ab cd'.
+_TOKEN_RE = re.compile(r'(?:"[^"]*(?:"|$)|[^\s"])+')
+
+# SAVE type keyword -> command name
+_SAVE_COMMANDS = {'html': 'save_html', 'text': 'save_text'}
+
+
+class ScriptParseError(ValueError):
+    """Raised when a script has syntax errors.
+    
+    Carries one message per invalid line in errors; the combined message
+    is only built when the exception is converted to a string.
+    """
+    
+    def __init__(self, errors: List[str]):
+        super().__init__(errors)
+        self.errors = errors
+    
+    def __str__(self):
+        return '\n'.join(self.errors)
+
+
+def _split_command(line: str) -> List[str]:
+    """Split command line, respecting quoted strings.
+    
+    Args:
+        line: Command line
+    
+    Returns:
+        List of parts
+    """
+    parts = [token.replace('"', '') for token in _TOKEN_RE.findall(line)]
+    # A token made only of quotes ("") is empty once unquoted
+    return [part for part in parts if part]
+
+
+def _parse_load(parts: List[str]) -> Dict:
+    """Parse LOAD command.
+    
+    Syntax: LOAD <URL> [nowait]
+    """
+    if len(parts) < 2:
+        raise ValueError("LOAD requires a URL")
+    
+    url = parts[1]
+    wait = not any(p.lower() == 'nowait' for p in parts[2:])
+    
+    return {
+        'command': 'load_url',
+        'url': url,
+        'wait_for_load': wait
+    }
+
+
+def _parse_wait(parts: List[str]) -> Dict:
+    """Parse WAIT command.
+    
+    Syntax: WAIT <SECONDS>
+    """
+    if len(parts) < 2:
+        raise ValueError("WAIT requires seconds")
+    
+    value = parts[1]
+    # Whole seconds are the common case; int() is cheaper than float().
+    # isascii() guards against digits like '²' that int() rejects.
+    if value.isascii() and value.isdigit():
+        seconds = int(value)
+    else:
+        try:
+            seconds = float(value)
+        except ValueError:
+            raise ValueError(f"WAIT seconds must be a number, got: {value}")
+    
+    if seconds < 0:
+        raise ValueError("WAIT seconds must be positive")
+    
+    return {
+        'command': 'pause',
+        'seconds': seconds
+    }
+
+
+def _parse_save(parts: List[str]) -> Dict:
+    """Parse SAVE command.
+    
+    Syntax: SAVE HTML|TEXT [TAG]
+    
+    Examples:
+        SAVE HTML
+        SAVE HTML panda
+        SAVE HTML "my data"
+        SAVE TEXT results
+    """
+    if len(parts) < 2:
+        raise ValueError("SAVE requires HTML or TEXT type")
+    
+    save_type = parts[1].lower()
+    command = _SAVE_COMMANDS.get(save_type)
+    if command is None:
+        raise ValueError(f"SAVE type must be HTML or TEXT, got: {save_type}")
+    
+    # Get optional tag (everything after the type; quotes were
+    # already removed by the tokenizer). A single token, quoted or
+    # not, is used as-is; unquoted words are joined with spaces.
+    tag = None
+    if len(parts) == 3:
+        tag = parts[2]
+    elif len(parts) > 3:
+        tag = ' '.join(parts[2:])
+    
+    result = {
+        'command': command
+    }
+    
+    if tag:
+        result['tag'] = tag
+    
+    return result
+
+
+# Command keyword -> parse function
+_DISPATCH = {
+    'load': _parse_load,
+    'wait': _parse_wait,
+    'save': _parse_save,
+}
+
+
+def _parse_line(line: str) -> Dict:
+    """Parse a single command line.
+    
+    Args:
+        line: Single command line (comments already removed)
+    
+    Returns:
+        Command dict or None if empty
+    """
+    parts = _split_command(line)
+    
+    if not parts:
+        return None
+    
+    # Try the keyword as written first; lowercase only on a miss
+    cmd = parts[0]
+    handler = _DISPATCH.get(cmd)
+    if handler is None:
+        cmd = cmd.lower()
+        handler = _DISPATCH.get(cmd)
+        if handler is None:
+            raise ValueError(f"Unknown command: {cmd}")
+    return handler(parts)
+
+
+def _parse_commands(script_text: str, errors: List[str]) -> List[Dict]:
+    """Parse script lines into command dicts.
+    
+    Args:
+        script_text: Simple format script text
+        errors: List that receives one message per invalid line
+    
+    Returns:
+        List of command dicts for the valid lines
+    """
+    commands = []
+    
+    for line_num, line in enumerate(script_text.splitlines(), 1):
+        # Remove comments and surrounding whitespace
+        line = line.partition('#')[0].strip()
+        
+        # Skip empty lines
+        if not line:
+            continue
+        
+        try:
+            cmd = _parse_line(line)
+            if cmd:
+                commands.append(cmd)
+        except ValueError as e:
+            errors.append(f"Line {line_num}: {e}")
+    
+    return commands
+
+
+def parse_simple_script(text: str) -> Dict:
+    """Parse simple script text and return its JSON representation.
+    
+    Args:
+        text: Simple format script text
+    
+    Returns:
+        Dict with 'version' and 'commands' keys
+    
+    Raises:
+        ScriptParseError: If script contains syntax errors
+    """
+    errors = []
+    commands = _parse_commands(text, errors)
+    
+    # If there are errors, raise
+    if errors:
+        raise ScriptParseError(errors)
+    
+    return {
+        'version': '1.0',
+        'commands': commands
+    }
+
 
 class SimpleScriptParser:
-    """Parse simple script format and convert to JSON."""
+    """Parse simple script format and convert to JSON.
+    
+    Kept for backward compatibility; parse_simple_script() is the
+    stateless entry point. The errors from the last parse() call are
+    available as the errors attribute.
+    """
     
     def __init__(self):
         """Initialize parser."""
@@ -25,184 +240,33 @@ class SimpleScriptParser:
         
         Args:
             script_text: Simple format script text
-            
+        
         Returns:
             Dict with 'version' and 'commands' keys
-            
+        
         Raises:
-            ValueError: If script contains syntax errors
+            ScriptParseError: If script contains syntax errors
         """
         self.errors = []
         self.warnings = []
         
-        # Split into lines
-        lines = script_text.strip().split('\n')
-        
-        commands = []
-        
-        for line_num, line in enumerate(lines, 1):
-            # Remove comments
-            if '#' in line:
-                line = line.split('#')[0]
-            
-            # Strip whitespace
-            line = line.strip()
-            
-            # Skip empty lines
-            if not line:
-                continue
-            
-            try:
-                cmd = self._parse_line(line)
-                if cmd:
-                    commands.append(cmd)
-            except ValueError as e:
-                self.errors.append(f"Line {line_num}: {e}")
+        commands = _parse_commands(script_text, self.errors)
         
         # If there are errors, raise
         if self.errors:
-            raise ValueError('\n'.join(self.errors))
+            raise ScriptParseError(self.errors)
         
         return {
             'version': '1.0',
             'commands': commands
         }
     
-    def _parse_line(self, line: str) -> Dict:
-        """Parse a single command line.
-        
-        Args:
-            line: Single command line (comments already removed)
-            
-        Returns:
-            Command dict or None if empty
-        """
-        parts = self._split_command(line)
-        
-        if not parts:
-            return None
-        
-        cmd = parts[0].lower()
-        
-        if cmd == 'load':
-            return self._parse_load(parts)
-        elif cmd == 'wait':
-            return self._parse_wait(parts)
-        elif cmd == 'save':
-            return self._parse_save(parts)
-        else:
-            raise ValueError(f"Unknown command: {cmd}")
-    
-    def _split_command(self, line: str) -> List[str]:
-        """Split command line, respecting quoted strings.
-        
-        Args:
-            line: Command line
-            
-        Returns:
-            List of parts
-        """
-        parts = []
-        current = ""
-        in_quotes = False
-        
-        for char in line:
-            if char == '"':
-                in_quotes = not in_quotes
-            elif char.isspace() and not in_quotes:
-                if current:
-                    parts.append(current)
-                    current = ""
-            else:
-                current += char
-        
-        if current:
-            parts.append(current)
-        
-        return parts
-    
-    def _parse_load(self, parts: List[str]) -> Dict:
-        """Parse LOAD command.
-        
-        Syntax: LOAD <URL> [nowait]
-        """
-        if len(parts) < 2:
-            raise ValueError("LOAD requires a URL")
-        
-        url = parts[1]
-        wait = 'nowait' not in [p.lower() for p in parts[2:]]
-        
-        return {
-            'command': 'load_url',
-            'url': url,
-            'wait_for_load': wait
-        }
-    
-    def _parse_wait(self, parts: List[str]) -> Dict:
-        """Parse WAIT command.
-        
-        Syntax: WAIT <SECONDS>
-        """
-        if len(parts) < 2:
-            raise ValueError("WAIT requires seconds")
-        
-        try:
-            seconds = float(parts[1])
-        except ValueError:
-            raise ValueError(f"WAIT seconds must be a number, got: {parts[1]}")
-        
-        if seconds < 0:
-            raise ValueError("WAIT seconds must be positive")
-        
-        return {
-            'command': 'pause',
-            'seconds': seconds
-        }
-    
-    def _parse_save(self, parts: List[str]) -> Dict:
-        """Parse SAVE command.
-        
-        Syntax: SAVE HTML|TEXT [TAG]
-        
-        Examples:
-            SAVE HTML
-            SAVE HTML panda
-            SAVE HTML "my data"
-            SAVE TEXT results
-        """
-        if len(parts) < 2:
-            raise ValueError("SAVE requires HTML or TEXT type")
-        
-        save_type = parts[1].lower()
-        if save_type not in ('html', 'text'):
-            raise ValueError(f"SAVE type must be HTML or TEXT, got: {save_type}")
-        
-        # Get optional tag (everything after the type)
-        tag = None
-        if len(parts) > 2:
-            # Join remaining parts as tag (handles quoted strings)
-            tag = ' '.join(parts[2:])
-            # Remove quotes if present
-            if tag.startswith('"') and tag.endswith('"'):
-                tag = tag[1:-1]
-        
-        command = 'save_html' if save_type == 'html' else 'save_text'
-        
-        result = {
-            'command': command
-        }
-        
-        if tag:
-            result['tag'] = tag
-        
-        return result
-    
     def validate(self, script_dict: Dict) -> Tuple[bool, List[str]]:
         """Validate parsed script.
         
         Args:
             script_dict: Parsed script dictionary
-            
+        
         Returns:
             Tuple of (is_valid, error_list)
         """
@@ -217,19 +281,3 @@ class SimpleScriptParser:
             errors.append("'commands' must be a list")
         
         return len(errors) == 0, errors
-
-
-def parse_simple_script(text: str) -> Dict:
-    """Convenience function to parse simple script.
-    
-    Args:
-        text: Simple format script text
-        
-    Returns:
-        JSON-compatible dict
-        
-    Raises:
-        ValueError: If script is invalid
-    """
-    parser = SimpleScriptParser()
-    return parser.parse(text)
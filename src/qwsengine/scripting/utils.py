@@ -0,0 +1,135 @@
+"""Shared helpers for script commands."""
+
+import os
+import string
+import time
+
+# O_BINARY only exists (and matters) on Windows
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+# Text longer than this (in characters) is encoded and written in slices
+# of _CHUNK_CHARS, so peak memory stays bounded for very large pages
+_STREAM_THRESHOLD = 1 << 22
+_CHUNK_CHARS = 1 << 16
+
+# Deletes every ASCII character that isn't alphanumeric or underscore
+_TAG_KEEP = frozenset(string.ascii_letters + string.digits + '_')
+_TAG_DELETE_TABLE = dict.fromkeys(i for i in range(128) if chr(i) not in _TAG_KEEP)
+
+
+def sanitize_tag(tag: str) -> str:
+    """Sanitize a user-supplied tag for use in a filename.
+    
+    Spaces become underscores; anything that isn't alphanumeric or an
+    underscore is dropped, as are leading/trailing underscores.
+    
+    Args:
+        tag: Raw tag from user
+    
+    Returns:
+        Sanitized tag, or None if nothing is left
+    """
+    if not tag:
+        return None
+    
+    tag = tag.strip().replace(' ', '_')
+    if tag.isascii():
+        tag = tag.translate(_TAG_DELETE_TABLE)
+    else:
+        # Keep non-ASCII letters and digits, as str.isalnum() does
+        tag = ''.join(c for c in tag if c.isalnum() or c == '_')
+    
+    return tag.strip('_') or None
+
+
+def timestamped_filename(extension: str, tag: str = None) -> str:
+    """Build a 'YYYYMMDDHHMMSS.mmm[_TAG].ext' filename for the current time.
+    
+    Args:
+        extension: File extension without the dot (e.g. 'html')
+        tag: Optional sanitized tag to include
+    
+    Returns:
+        Filename like: 20251222185623.456.html or 20251222185623.456_panda.html
+    """
+    now = time.time()
+    stamp = time.strftime('%Y%m%d%H%M%S', time.localtime(now))
+    milliseconds = int(now % 1 * 1000)
+    
+    if tag:
+        return f"{stamp}.{milliseconds:03d}_{tag}.{extension}"
+    return f"{stamp}.{milliseconds:03d}.{extension}"
+
+
+def _write_all(fd: int, data: bytes):
+    """Write all of data to fd, retrying on partial writes."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def write_text_file(path, text: str):
+    """Write text to a file as UTF-8.
+    
+    Encodes the string in one go and hands the bytes straight to
+    os.write(), bypassing Python's buffered and text-mode file layers.
+    Very large text is encoded and written in 64K-character slices.
+    
+    Args:
+        path: Destination file path
+        text: Text content to write
+    
+    Raises:
+        UnicodeEncodeError: If text contains lone surrogates, as writing
+            through a text-mode file would
+    """
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        if len(text) <= _STREAM_THRESHOLD:
+            _write_all(fd, text.encode('utf-8'))
+        else:
+            for start in range(0, len(text), _CHUNK_CHARS):
+                chunk = text[start:start + _CHUNK_CHARS]
+                _write_all(fd, chunk.encode('utf-8'))
+    finally:
+        os.close(fd)
+
+
+def fetch_page_content(page, html: bool = True, text_script: str = None):
+    """Fetch a page's HTML and/or a script result with a single wait.
+    
+    All requests are submitted up front, then one QEventLoop runs until
+    every callback has fired, instead of one loop per request.
+    
+    Args:
+        page: QWebEnginePage to query
+        html: Request the page HTML via toHtml()
+        text_script: Optional JavaScript to run; its result is returned as text
+    
+    Returns:
+        (html, text) tuple; entries that were not requested are None
+    """
+    from PySide6.QtCore import QEventLoop
+    
+    results = {}
+    expected = int(html) + int(text_script is not None)
+    loop = QEventLoop()
+    
+    def make_callback(key):
+        def callback(value):
+            results[key] = value
+            if len(results) == expected:
+                loop.quit()
+        return callback
+    
+    if html:
+        page.toHtml(make_callback('html'))
+    if text_script is not None:
+        page.runJavaScript(text_script, make_callback('text'))
+    
+    # Callbacks normally arrive asynchronously; don't wait if they already ran
+    if len(results) < expected:
+        loop.exec()
+    
+    return results.get('html'), results.get('text')
@@ -1,11 +1,33 @@
-"""QWSEngine UI package."""
+"""QWSEngine UI package.
 
-from .browser_window import BrowserWindow
-from .browser_tab import BrowserTab
-from .browser_controller_window import BrowserControllerWindow
+The window classes are imported on first access, so importing a
+submodule (e.g. qwsengine.ui.browser_window) doesn't pull in the others.
+"""
+
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY = {
+    'BrowserWindow': '.browser_window',
+    'BrowserTab': '.browser_tab',
+    'BrowserControllerWindow': '.browser_controller_window',
+}
 
 __all__ = [
     'BrowserWindow',
     'BrowserTab',
     'BrowserControllerWindow',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
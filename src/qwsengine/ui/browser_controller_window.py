@@ -1522,13 +1522,15 @@ class BrowserControllerWindow(QMainWindow):
                 self.settings_manager = SettingsManager()
 
             dlg = SettingsDialog(self, self.settings_manager)
+            if hasattr(self, "update_status"):
+                # The file may still be written after exec() returns
+                dlg.saved.connect(lambda: self.update_status("Settings saved."))
+                dlg.save_failed.connect(lambda message: self.update_status(message, "ERROR"))
             if dlg.exec():
-                # Settings saved – refresh fields and the displayed path
+                # Settings applied – refresh fields and the displayed path
                 if hasattr(self, "load_settings"):
                     self.load_settings()
                 self._refresh_settings_path_label()
-                if hasattr(self, "update_status"):
-                    self.update_status("Settings saved.")
             else:
                 if hasattr(self, "update_status"):
                     self.update_status("Settings unchanged.")
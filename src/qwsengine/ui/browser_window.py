@@ -617,11 +617,11 @@ class BrowserWindow(QMainWindow):
         try:
             self.settings_manager.log_system_event("browser_window", "Settings dialog opening...")
             dialog = SettingsDialog(self, self.settings_manager)
+            dialog.saved.connect(lambda: self.settings_manager.log_system_event("browser_window", "Settings saved"))
+            dialog.save_failed.connect(lambda message: self.show_status(message, level="ERROR"))
             self.settings_manager.log_system_event("browser_window", "Settings dialog created")
             result = dialog.exec()
-            if result == QDialog.Accepted:
-                self.settings_manager.log_system_event("browser_window", "Settings saved")
-            else:
+            if result != QDialog.Accepted:
                 self.settings_manager.log_system_event("browser_window", "Settings dialog cancelled")
         except Exception as e:
             self.settings_manager.log_error("browser_window", f"Failed to open settings dialog: {str(e)}")
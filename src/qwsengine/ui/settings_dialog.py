@@ -6,11 +6,114 @@ Provides comprehensive settings UI with tabs and helper dialogs
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QCheckBox,
     QPushButton, QMessageBox, QTabWidget, QWidget, QSpinBox, QComboBox,
-    QGroupBox, QFileDialog, QTextEdit, QFormLayout, QGridLayout, QSizePolicy
+    QGroupBox, QFileDialog, QTextEdit, QFormLayout, QGridLayout, QSizePolicy,
+    QApplication
+)
+from PySide6.QtCore import (
+    Qt, QTimer, QObject, QRunnable, QThreadPool, QSignalBlocker, Signal
 )
-from PySide6.QtCore import Qt
 from PySide6.QtGui import QIntValidator
-import json
+import re
+
+from ..utils import serialization
+
+# Start URL: http(s) scheme followed by a host/path without whitespace
+_URL_RE = re.compile(r'^(https?)://\S+$', re.IGNORECASE)
+
+# Default value for every setting the dialog edits. Used for keys
+# missing from the settings manager and by "Reset to Defaults".
+DEFAULT_SETTINGS: dict = {
+    # General
+    "auto_launch_browser": True,
+    "start_url": "https://codaland.com/ipdefault",
+    "window_width": 1024,
+    "window_height": 768,
+    
+    # Privacy
+    "user_agent": "",
+    "accept_language": "en-US,en;q=0.9",
+    "send_dnt": False,
+    "spoof_chrome_client_hints": False,
+    "persist_cookies": True,
+    "persist_cache": True,
+    
+    # Proxy
+    "proxy_mode": "manual",
+    "proxy_type": "http",
+    "proxy_host": "",
+    "proxy_port": 0,
+    "proxy_user": "",
+    "proxy_password": "",
+    
+    # Logging
+    "logging_enabled": True,
+    "log_navigation": True,
+    "log_tab_actions": True,
+    "log_errors": True,
+    
+    # Scripting
+    "save_folder": "./output/captures",
+    
+    # Advanced
+    "headers_global": {},
+    "headers_per_host": {},
+}
+
+
+def _parse_header_text(text):
+    """Parse header JSON text.
+    
+    Returns:
+        Tuple of (headers, error); headers is {} for empty text and None
+        when error (a message string) is set
+    """
+    if not text:
+        return {}, None
+    try:
+        return serialization.loads(text), None
+    except serialization.JSONDecodeError as e:
+        return None, str(e)
+
+
+def _parse_header_texts(texts):
+    """Parse several header texts; runs on a worker thread.
+    
+    Args:
+        texts: Dict of editor name -> text
+    
+    Returns:
+        Dict of editor name -> (text, headers, error)
+    """
+    return {name: (text,) + _parse_header_text(text) for name, text in texts.items()}
+
+
+class _TaskSignals(QObject):
+    """Signals for _Task (QRunnable is not a QObject)."""
+    
+    finished = Signal(str, object)  # tag, result
+
+
+class _Task(QRunnable):
+    """Run fn(*args) on a QThreadPool worker thread.
+    
+    The result is emitted through signals.finished together with tag;
+    connecting it to a QObject method delivers it on that object's
+    thread. If fn raises, the result is None.
+    """
+    
+    def __init__(self, tag, fn, *args):
+        super().__init__()
+        self.tag = tag
+        self.fn = fn
+        self.args = args
+        self.signals = _TaskSignals()
+    
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception:
+            result = None
+        self.signals.finished.emit(self.tag, result)
 
 
 class SettingsDialog(QDialog):
@@ -24,17 +127,95 @@ class SettingsDialog(QDialog):
     - Logging: Log settings and file access
     - Scripting: Script execution settings
     - Advanced: Custom headers, browser data
+    
+    Save closes the dialog as soon as the new values are applied and
+    writes settings.json in the background; saved or save_failed is
+    emitted once that write finishes, possibly after exec() returned.
+    Shift+Save keeps the dialog open until the file is written.
     """
     
+    # Emitted once settings.json holds the accepted settings
+    saved = Signal()
+    # Emitted with an error message when a background save fails
+    save_failed = Signal(str)
+    
+    # Per tab (same order as the tabs): (widget attribute, settings key,
+    # widget kind) for every plain widget. Header JSON is handled by
+    # _load_advanced and _save_settings. "text" values are stripped on
+    # save, "secret" values are saved as typed.
+    _SCHEMA = (
+        # General
+        (
+            ("auto_launch",         "auto_launch_browser",        "check"),
+            ("start_url",           "start_url",                  "text"),
+            ("window_width",        "window_width",               "int"),
+            ("window_height",       "window_height",              "int"),
+        ),
+        # Privacy
+        (
+            ("user_agent",          "user_agent",                 "text"),
+            ("accept_language",     "accept_language",            "text"),
+            ("send_dnt",            "send_dnt",                   "check"),
+            ("spoof_chrome_hints",  "spoof_chrome_client_hints",  "check"),
+            ("persist_cookies",     "persist_cookies",            "check"),
+            ("persist_cache",       "persist_cache",              "check"),
+        ),
+        # Proxy
+        (
+            ("proxy_mode",          "proxy_mode",                 "combo"),
+            ("proxy_type",          "proxy_type",                 "combo"),
+            ("proxy_host",          "proxy_host",                 "text"),
+            ("proxy_port",          "proxy_port",                 "int"),
+            ("proxy_user",          "proxy_user",                 "text"),
+            ("proxy_password",      "proxy_password",             "secret"),
+        ),
+        # Logging
+        (
+            ("logging_enabled",     "logging_enabled",            "check"),
+            ("log_navigation",      "log_navigation",             "check"),
+            ("log_tab_actions",     "log_tab_actions",            "check"),
+            ("log_errors",          "log_errors",                 "check"),
+        ),
+        # Scripting
+        (
+            ("save_folder",         "save_folder",                "text"),
+        ),
+        # Advanced
+        (),
+    )
+    
+    # Widget kind -> setter, called as setter(widget, value)
+    _SETTERS = {
+        "check": QCheckBox.setChecked,
+        "text": QLineEdit.setText,
+        "secret": QLineEdit.setText,
+        "int": QSpinBox.setValue,
+        "combo": QComboBox.setCurrentText,
+    }
+    
+    # Widget kind -> getter method name, bound per widget when its tab
+    # is built
+    _GETTERS = {
+        "check": "isChecked",
+        "text": "text",
+        "secret": "text",
+        "int": "value",
+        "combo": "currentText",
+    }
+    
     def __init__(self, parent=None, settings_manager=None):
         super().__init__(parent)
         self.settings_manager = settings_manager
+        self._snapshot = None
+        self._pending_save = None
+        self._changed_keys = ()
+        self._wait_for_save = False
+        self._message_boxes = {}
         self.setWindowTitle("QWE Settings")
         self.setModal(True)
         self.resize(700, 600)
         
         self._setup_ui()
-        self._load_current_settings()
     
     def _setup_ui(self):
         """Create the main UI layout with tabs."""
@@ -43,13 +224,24 @@ class SettingsDialog(QDialog):
         # Create tab widget
         self.tabs = QTabWidget()
         
-        # Add tabs
-        self.tabs.addTab(self._create_general_tab(), "General")
-        self.tabs.addTab(self._create_privacy_tab(), "Privacy && Security")
-        self.tabs.addTab(self._create_proxy_tab(), "Proxy")
-        self.tabs.addTab(self._create_logging_tab(), "Logging")
-        self.tabs.addTab(self._create_scripting_tab(), "Scripting")
-        self.tabs.addTab(self._create_advanced_tab(), "Advanced")
+        # Tabs are built on first activation: (title, build, load)
+        self._tab_pages = [
+            ("General", self._create_general_tab, self._load_general),
+            ("Privacy && Security", self._create_privacy_tab, self._load_privacy),
+            ("Proxy", self._create_proxy_tab, self._load_proxy),
+            ("Logging", self._create_logging_tab, self._load_logging),
+            ("Scripting", self._create_scripting_tab, self._load_scripting),
+            ("Advanced", self._create_advanced_tab, self._load_advanced),
+        ]
+        self._tab_built = set()
+        # Tab index -> ((settings key, bound getter, strip), ...)
+        self._field_getters = {}
+        
+        # Add placeholder tabs
+        for title, _, _ in self._tab_pages:
+            self.tabs.addTab(QWidget(), title)
+        
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
         
         main_layout.addWidget(self.tabs)
         
@@ -62,23 +254,66 @@ class SettingsDialog(QDialog):
         # Buttons
         button_layout = QHBoxLayout()
         
-        reset_button = QPushButton("Reset to Defaults")
-        reset_button.setToolTip("Reset all settings to default values")
-        reset_button.clicked.connect(self._reset_to_defaults)
+        self.reset_button = QPushButton("Reset to Defaults")
+        self.reset_button.setToolTip("Reset all settings to default values")
+        self.reset_button.clicked.connect(self._reset_to_defaults)
         
-        cancel_button = QPushButton("Cancel")
-        cancel_button.clicked.connect(self.reject)
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.reject)
         
-        save_button = QPushButton("Save")
-        save_button.setDefault(True)
-        save_button.clicked.connect(self._save_settings)
+        self.save_button = QPushButton("Save")
+        self.save_button.setDefault(True)
+        self.save_button.clicked.connect(self._save_settings)
         
-        button_layout.addWidget(reset_button)
+        button_layout.addWidget(self.reset_button)
         button_layout.addStretch()
-        button_layout.addWidget(cancel_button)
-        button_layout.addWidget(save_button)
+        button_layout.addWidget(self.cancel_button)
+        button_layout.addWidget(self.save_button)
         
         main_layout.addLayout(button_layout)
+        
+        # Build the first tab so it shows immediately
+        self._ensure_tab_built(0)
+    
+    def _ensure_tab_built(self, index):
+        """Build the tab at index if it is still a placeholder.
+        
+        The built tab replaces the placeholder and is filled from the
+        current settings.
+        
+        Args:
+            index: Tab index (negative values are ignored)
+        """
+        if index < 0 or index in self._tab_built:
+            return
+        self._tab_built.add(index)
+        
+        title, build, load = self._tab_pages[index]
+        widget = build()
+        self._field_getters[index] = tuple(
+            (key, getattr(getattr(self, attr), self._GETTERS[kind]), kind == "text")
+            for attr, key, kind in self._SCHEMA[index]
+        )
+        
+        # Swap in the real tab without re-entering via currentChanged
+        current = self.tabs.currentIndex()
+        placeholder = self.tabs.widget(index)
+        self.tabs.blockSignals(True)
+        try:
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, widget, title)
+            self.tabs.setCurrentIndex(current)
+        finally:
+            self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+        
+        if self.settings_manager:
+            load()
+    
+    def _ensure_all_tabs_built(self):
+        """Build every tab that hasn't been opened yet."""
+        for index in range(len(self._tab_pages)):
+            self._ensure_tab_built(index)
     
     # =========================================================================
     # TAB 1: GENERAL
@@ -296,11 +531,7 @@ class SettingsDialog(QDialog):
         self.proxy_manual_group = manual_group
         
         # Enable/disable manual settings based on mode
-        def update_proxy_fields():
-            manual = (self.proxy_mode.currentText() == "manual")
-            self.proxy_manual_group.setEnabled(manual)
-        
-        self.proxy_mode.currentTextChanged.connect(lambda: update_proxy_fields())
+        self.proxy_mode.currentTextChanged.connect(self._update_proxy_fields)
         
         proxy_group.setLayout(proxy_layout)
         layout.addWidget(proxy_group)
@@ -350,13 +581,7 @@ class SettingsDialog(QDialog):
         logging_layout.addLayout(log_options_layout)
         
         # Enable/disable log options based on master switch
-        def update_log_options():
-            enabled = self.logging_enabled.isChecked()
-            self.log_navigation.setEnabled(enabled)
-            self.log_tab_actions.setEnabled(enabled)
-            self.log_errors.setEnabled(enabled)
-        
-        self.logging_enabled.toggled.connect(update_log_options)
+        self.logging_enabled.toggled.connect(self._update_log_options)
         
         logging_group.setLayout(logging_layout)
         layout.addWidget(logging_group)
@@ -531,11 +756,31 @@ class SettingsDialog(QDialog):
         
         headers_layout.addLayout(host_layout)
         
-        # Validate button
+        # Parse results per editor, re-parsed only when the text changes.
+        # Parsing is debounced so typing doesn't parse on every keystroke,
+        # and runs on the thread pool (see _revalidate_headers).
+        self._parsed_headers = {}
+        # Headers whose JSON text is still being built off the UI thread
+        self._pending_headers = {}
+        self._headers_check_timer = QTimer(self)
+        self._headers_check_timer.setSingleShot(True)
+        self._headers_check_timer.setInterval(300)
+        self._headers_check_timer.timeout.connect(self._revalidate_headers)
+        self.headers_global.textChanged.connect(self._headers_check_timer.start)
+        self.headers_per_host.textChanged.connect(self._headers_check_timer.start)
+        
+        # Validate button and live status
+        validate_layout = QHBoxLayout()
         validate_btn = QPushButton("Validate JSON")
         validate_btn.setToolTip("Check if headers are valid JSON")
         validate_btn.clicked.connect(self._validate_headers)
-        headers_layout.addWidget(validate_btn)
+        validate_layout.addWidget(validate_btn)
+        
+        self.headers_status = QLabel()
+        self.headers_status.setWordWrap(True)
+        validate_layout.addWidget(self.headers_status, 1)
+        
+        headers_layout.addLayout(validate_layout)
         
         headers_group.setLayout(headers_layout)
         layout.addWidget(headers_group)
@@ -563,107 +808,125 @@ class SettingsDialog(QDialog):
     # LOAD CURRENT SETTINGS
     # =========================================================================
     
+    def _settings_snapshot(self):
+        """Return current settings merged over the dialog defaults.
+        
+        The settings manager is read once; tabs built later reuse the
+        same snapshot until _load_current_settings() refreshes it.
+        """
+        if self._snapshot is None:
+            self._snapshot = {**DEFAULT_SETTINGS, **self.settings_manager.snapshot()}
+        return self._snapshot
+    
     def _load_current_settings(self):
-        """Load current settings from SettingsManager into UI controls."""
+        """Load current settings from SettingsManager into built tabs."""
         if not self.settings_manager:
             return
         
-        # General
-        self.auto_launch.setChecked(
-            self.settings_manager.get("auto_launch_browser", True)
-        )
-        self.start_url.setText(
-            self.settings_manager.get("start_url", "https://codaland.com/ipdefault")
-        )
-        self.window_width.setValue(
-            self.settings_manager.get("window_width", 1024)
-        )
-        self.window_height.setValue(
-            self.settings_manager.get("window_height", 768)
-        )
-        
-        # Privacy
-        self.user_agent.setText(
-            self.settings_manager.get("user_agent", "")
-        )
-        self.accept_language.setText(
-            self.settings_manager.get("accept_language", "en-US,en;q=0.9")
-        )
-        self.send_dnt.setChecked(
-            self.settings_manager.get("send_dnt", False)
-        )
-        self.spoof_chrome_hints.setChecked(
-            self.settings_manager.get("spoof_chrome_client_hints", False)
-        )
-        self.persist_cookies.setChecked(
-            self.settings_manager.get("persist_cookies", True)
-        )
-        self.persist_cache.setChecked(
-            self.settings_manager.get("persist_cache", True)
-        )
-        
-        # Proxy
-        self.proxy_mode.setCurrentText(
-            self.settings_manager.get("proxy_mode", "system")
-        )
-        self.proxy_type.setCurrentText(
-            self.settings_manager.get("proxy_type", "http")
-        )
-        self.proxy_host.setText(
-            self.settings_manager.get("proxy_host", "")
-        )
-        self.proxy_port.setValue(
-            self.settings_manager.get("proxy_port", 0)
-        )
-        self.proxy_user.setText(
-            self.settings_manager.get("proxy_user", "")
-        )
-        self.proxy_password.setText(
-            self.settings_manager.get("proxy_password", "")
-        )
-        
-        # Trigger proxy fields update
-        self.proxy_mode.currentTextChanged.emit(self.proxy_mode.currentText())
-        
-        # Logging
-        self.logging_enabled.setChecked(
-            self.settings_manager.get("logging_enabled", True)
-        )
-        self.log_navigation.setChecked(
-            self.settings_manager.get("log_navigation", True)
-        )
-        self.log_tab_actions.setChecked(
-            self.settings_manager.get("log_tab_actions", True)
-        )
-        self.log_errors.setChecked(
-            self.settings_manager.get("log_errors", True)
-        )
-        
-        # Trigger log options update
-        self.logging_enabled.toggled.emit(self.logging_enabled.isChecked())
+        self._snapshot = None
+        for index in sorted(self._tab_built):
+            self._tab_pages[index][2]()
+    
+    def _apply_tab(self, index, values):
+        """Set the plain widgets of one tab from a settings dict.
+        
+        Args:
+            index: Tab index into _SCHEMA
+            values: Dict holding every key the tab uses
+        """
+        setters = self._SETTERS
+        for attr, key, kind in self._SCHEMA[index]:
+            setters[kind](getattr(self, attr), values[key])
+    
+    def _load_general(self):
+        """Load General tab settings."""
+        self._apply_tab(0, self._settings_snapshot())
+    
+    def _load_privacy(self):
+        """Load Privacy tab settings."""
+        self._apply_tab(1, self._settings_snapshot())
+    
+    def _load_proxy(self):
+        """Load Proxy tab settings."""
+        self._apply_tab(2, self._settings_snapshot())
         
-        # Scripting
-        self.save_folder.setText(
-            self.settings_manager.get("save_folder", "./output/captures")
-        )
+        self._update_proxy_fields()
+    
+    def _load_logging(self):
+        """Load Logging tab settings."""
+        self._apply_tab(3, self._settings_snapshot())
         
-        # Advanced - Headers
-        headers_global = self.settings_manager.get("headers_global", {})
-        if headers_global:
-            self.headers_global.setPlainText(
-                json.dumps(headers_global, indent=2)
+        self._update_log_options()
+    
+    def _load_scripting(self):
+        """Load Scripting tab settings."""
+        self._apply_tab(4, self._settings_snapshot())
+    
+    def _load_advanced(self):
+        """Load Advanced tab header settings."""
+        settings = self._settings_snapshot()
+        
+        # Serialize on the thread pool; the editors fill in when done
+        for name in ("headers_global", "headers_per_host"):
+            headers = settings[name]
+            if not headers:
+                continue
+            self._pending_headers[name] = headers
+            self._start_task(
+                self._set_headers_text, name,
+                serialization.dumps_indented, headers
             )
+    
+    def _set_headers_text(self, name, text):
+        """Fill a header editor with JSON built on the thread pool.
+        
+        Ignored if the load was superseded (reset) or the user has
+        already typed into the editor.
+        """
+        if text is None:
+            # Serializing failed; the editor stays empty and saving
+            # keeps the loaded headers
+            return
         
-        headers_per_host = self.settings_manager.get("headers_per_host", {})
-        if headers_per_host:
-            self.headers_per_host.setPlainText(
-                json.dumps(headers_per_host, indent=2)
-            )
+        headers = self._pending_headers.pop(name, None)
+        editor = getattr(self, name)
+        if headers is None or editor.toPlainText():
+            return
+        
+        # Seed the parse cache so the debounced check doesn't re-parse
+        self._parsed_headers[name] = (text.strip(), headers, None)
+        editor.setPlainText(text)
     
     # =========================================================================
     # HELPER METHODS
     # =========================================================================
     
+    def _start_task(self, slot, tag, fn, *args):
+        """Run fn(*args) on the global thread pool.
+        
+        Args:
+            slot: Method of this dialog called as slot(tag, result) on the
+                UI thread
+            tag: String passed back to slot
+            fn: Callable to run on the worker thread
+            *args: Arguments for fn
+        """
+        task = _Task(tag, fn, *args)
+        task.signals.finished.connect(slot)
+        QThreadPool.globalInstance().start(task)
+    
+    def _update_proxy_fields(self):
+        """Enable the manual proxy settings only in manual mode."""
+        manual = (self.proxy_mode.currentText() == "manual")
+        self.proxy_manual_group.setEnabled(manual)
+    
+    def _update_log_options(self):
+        """Enable the individual log options only when logging is on."""
+        enabled = self.logging_enabled.isChecked()
+        self.log_navigation.setEnabled(enabled)
+        self.log_tab_actions.setEnabled(enabled)
+        self.log_errors.setEnabled(enabled)
+    
     def _browse_save_folder(self):
         """Open folder browser for save folder."""
         current_folder = self.save_folder.text() or "./output/captures"
@@ -678,25 +941,111 @@ class SettingsDialog(QDialog):
         if folder:
             self.save_folder.setText(folder)
     
-    def _validate_headers(self):
-        """Validate that header JSON is valid."""
+    def _parse_header_editor(self, name):
+        """Parse the JSON in a header editor.
+        
+        The result is cached per editor and reused while its text is
+        unchanged, so repeated validation doesn't re-parse.
+        
+        Args:
+            name: Editor attribute name ("headers_global" or
+                "headers_per_host")
+        
+        Returns:
+            Tuple of (headers, error); headers is {} for an empty editor
+            and None when error (a message string) is set
+        """
+        text, result = self._header_state(name)
+        if result is None:
+            result = _parse_header_text(text)
+            self._parsed_headers[name] = (text,) + result
+        return result
+    
+    def _header_state(self, name):
+        """Return a header editor's text and its parse result if known.
+        
+        Args:
+            name: Editor attribute name
+        
+        Returns:
+            Tuple of (text, result); result is (headers, error) when it is
+            cached or still pending from loading, and None when the text
+            has to be parsed
+        """
+        text = getattr(self, name).toPlainText().strip()
+        if not text and name in self._pending_headers:
+            # Loaded headers whose text hasn't arrived yet
+            return text, (self._pending_headers[name], None)
+        
+        cached = self._parsed_headers.get(name)
+        if cached is not None and cached[0] == text:
+            return text, cached[1:]
+        return text, None
+    
+    def _check_headers(self):
+        """Parse both header editors, returning the error messages."""
         errors = []
         
         # Validate global headers
-        global_text = self.headers_global.toPlainText().strip()
-        if global_text:
-            try:
-                json.loads(global_text)
-            except json.JSONDecodeError as e:
-                errors.append(f"Global headers: {e}")
+        _, error = self._parse_header_editor("headers_global")
+        if error:
+            errors.append(f"Global headers: {error}")
         
         # Validate per-host headers
-        host_text = self.headers_per_host.toPlainText().strip()
-        if host_text:
-            try:
-                json.loads(host_text)
-            except json.JSONDecodeError as e:
-                errors.append(f"Per-host headers: {e}")
+        _, error = self._parse_header_editor("headers_per_host")
+        if error:
+            errors.append(f"Per-host headers: {error}")
+        
+        return errors
+    
+    def _revalidate_headers(self):
+        """Re-check header JSON after typing pauses.
+        
+        Changed text is parsed on the thread pool; the status label is
+        updated once results are in.
+        """
+        unparsed = {}
+        for name in ("headers_global", "headers_per_host"):
+            text, result = self._header_state(name)
+            if result is None:
+                unparsed[name] = text
+        
+        if unparsed:
+            self._start_task(
+                self._on_headers_revalidated, "revalidate",
+                _parse_header_texts, unparsed
+            )
+        else:
+            self._update_headers_status()
+    
+    def _on_headers_revalidated(self, _tag, parsed):
+        """Store background parse results and refresh the status label."""
+        if parsed is None:
+            return
+        self._parsed_headers.update(parsed)
+        self._update_headers_status()
+    
+    def _update_headers_status(self):
+        """Show whether the header JSON is valid next to Validate JSON."""
+        states = [self._header_state(name)
+                  for name in ("headers_global", "headers_per_host")]
+        if any(result is None for _, result in states):
+            # Text changed since the parse started; another check follows
+            return
+        
+        errors = self._check_headers()
+        if errors:
+            self.headers_status.setStyleSheet("color: red;")
+            self.headers_status.setText("\u2717 " + "; ".join(errors))
+        elif any(text for text, _ in states):
+            self.headers_status.setStyleSheet("color: green;")
+            self.headers_status.setText("\u2713 Valid JSON")
+        else:
+            self.headers_status.clear()
+    
+    def _validate_headers(self):
+        """Validate that header JSON is valid."""
+        errors = self._check_headers()
         
         if errors:
             QMessageBox.warning(
@@ -786,188 +1135,256 @@ class SettingsDialog(QDialog):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            # General
-            self.auto_launch.setChecked(True)
-            self.start_url.setText("https://codaland.com/ipdefault")
-            self.window_width.setValue(1024)
-            self.window_height.setValue(768)
-            
-            # Privacy
-            self.user_agent.clear()
-            self.accept_language.setText("en-US,en;q=0.9")
-            self.send_dnt.setChecked(False)
-            self.spoof_chrome_hints.setChecked(False)
-            self.persist_cookies.setChecked(True)
-            self.persist_cache.setChecked(True)
-            
-            # Proxy
-            self.proxy_mode.setCurrentText("manual")
-            self.proxy_type.setCurrentText("http")
-            self.proxy_host.clear()
-            self.proxy_port.setValue(0)
-            self.proxy_user.clear()
-            self.proxy_password.clear()
+            # Defaults are saved for every tab, so every tab needs widgets
+            self._ensure_all_tabs_built()
             
-            # Logging
-            self.logging_enabled.setChecked(True)
-            self.log_navigation.setChecked(True)
-            self.log_tab_actions.setChecked(True)
-            self.log_errors.setChecked(True)
-            
-            # Scripting
-            self.save_folder.setText("./output/captures")
+            # Block change signals while the widgets are set; the
+            # dependent state is refreshed once afterwards
+            widgets = [getattr(self, attr)
+                       for fields in self._SCHEMA for attr, _, _ in fields]
+            widgets += [self.headers_global, self.headers_per_host]
+            blockers = [QSignalBlocker(widget) for widget in widgets]
+            try:
+                for index in range(len(self._SCHEMA)):
+                    self._apply_tab(index, DEFAULT_SETTINGS)
+                
+                # Advanced
+                self._pending_headers.clear()
+                self.headers_global.clear()
+                self.headers_per_host.clear()
+            finally:
+                for blocker in blockers:
+                    blocker.unblock()
             
-            # Advanced
-            self.headers_global.clear()
-            self.headers_per_host.clear()
+            self._update_proxy_fields()
+            self._update_log_options()
+            self._revalidate_headers()
     
     # =========================================================================
     # SAVE SETTINGS
     # =========================================================================
     
     def _save_settings(self):
-        """Save all settings."""
+        """Save all settings.
+        
+        Only tabs that have been built are collected; settings on tabs
+        the user never opened keep their current values. Header JSON that
+        isn't parsed yet is parsed, and the settings file is written, on
+        the thread pool. The dialog closes once the new values are
+        applied, or once the file is written when Shift is held.
+        """
         try:
             # Validate inputs
             if not self._validate_inputs():
                 return
             
-            # Parse headers JSON
-            headers_global = {}
-            headers_per_host = {}
-            
-            global_text = self.headers_global.toPlainText().strip()
-            if global_text:
-                try:
-                    headers_global = json.loads(global_text)
-                except json.JSONDecodeError as e:
-                    QMessageBox.warning(
-                        self,
-                        "Invalid JSON",
-                        f"Global headers JSON is invalid: {e}"
-                    )
-                    return
+            settings = {}
+            for index in sorted(self._tab_built):
+                for key, get, strip in self._field_getters[index]:
+                    value = get()
+                    settings[key] = value.strip() if strip else value
             
-            host_text = self.headers_per_host.toPlainText().strip()
-            if host_text:
-                try:
-                    headers_per_host = json.loads(host_text)
-                except json.JSONDecodeError as e:
-                    QMessageBox.warning(
-                        self,
-                        "Invalid JSON",
-                        f"Per-host headers JSON is invalid: {e}"
-                    )
-                    return
+            # Header texts without a cached parse result
+            unparsed = {}
+            if 5 in self._tab_built:
+                for name in ("headers_global", "headers_per_host"):
+                    text, result = self._header_state(name)
+                    if result is None:
+                        unparsed[name] = text
             
-            # Save all settings
-            settings = {
-                # General
-                "auto_launch_browser": self.auto_launch.isChecked(),
-                "start_url": self.start_url.text().strip(),
-                "window_width": self.window_width.value(),
-                "window_height": self.window_height.value(),
-                
-                # Privacy
-                "user_agent": self.user_agent.text().strip(),
-                "accept_language": self.accept_language.text().strip(),
-                "send_dnt": self.send_dnt.isChecked(),
-                "spoof_chrome_client_hints": self.spoof_chrome_hints.isChecked(),
-                "persist_cookies": self.persist_cookies.isChecked(),
-                "persist_cache": self.persist_cache.isChecked(),
-                
-                # Proxy
-                "proxy_mode": self.proxy_mode.currentText(),
-                "proxy_type": self.proxy_type.currentText(),
-                "proxy_host": self.proxy_host.text().strip(),
-                "proxy_port": self.proxy_port.value(),
-                "proxy_user": self.proxy_user.text().strip(),
-                "proxy_password": self.proxy_password.text(),
-                
-                # Logging
-                "logging_enabled": self.logging_enabled.isChecked(),
-                "log_navigation": self.log_navigation.isChecked(),
-                "log_tab_actions": self.log_tab_actions.isChecked(),
-                "log_errors": self.log_errors.isChecked(),
-                
-                # Scripting
-                "save_folder": self.save_folder.text().strip(),
+            self._pending_save = settings
+            self._wait_for_save = bool(
+                QApplication.keyboardModifiers() & Qt.KeyboardModifier.ShiftModifier
+            )
+            self._set_saving(True)
+            if unparsed:
+                self._start_task(
+                    self._on_headers_parsed, "parsed",
+                    _parse_header_texts, unparsed
+                )
+            else:
+                self._on_headers_parsed("parsed", {})
                 
-                # Advanced
-                "headers_global": headers_global,
-                "headers_per_host": headers_per_host,
+        except Exception as e:
+            self._set_saving(False)
+            self._show_message(
+                QMessageBox.Icon.Critical,
+                "Error",
+                f"An error occurred while saving: {str(e)}"
+            )
+    
+    def _on_headers_parsed(self, _tag, parsed):
+        """Apply collected settings and start writing the settings file.
+        
+        Args:
+            _tag: Task tag (unused)
+            parsed: Dict of editor name -> (text, headers, error) from
+                _parse_header_texts
+        """
+        try:
+            # A failed background parse is redone below on this thread
+            self._parsed_headers.update(parsed or {})
+            settings = self._pending_save
+            
+            if 5 in self._tab_built:
+                for name, label in (("headers_global", "Global"),
+                                    ("headers_per_host", "Per-host")):
+                    headers, error = self._parse_header_editor(name)
+                    if error:
+                        self._set_saving(False)
+                        self._show_message(
+                            QMessageBox.Icon.Warning,
+                            "Invalid JSON",
+                            f"{label} headers JSON is invalid: {error}"
+                        )
+                        return
+                    settings[name] = headers
+            
+            current = self.settings_manager.snapshot()
+            changed = {
+                key: value for key, value in settings.items()
+                if key not in current or current[key] != value
             }
             
+            # Nothing changed: skip the file write and re-applying
+            # proxy/network settings
+            if not changed:
+                self._set_saving(False)
+                self.accept()
+                self.saved.emit()
+                return
+            
             # Apply settings
-            for key, value in settings.items():
-                self.settings_manager.set(key, value, persist=False)
+            self.settings_manager.update(changed, persist=False)
+            self._changed_keys = tuple(changed)
+            
+            # Save to file; serialized here so the worker never reads
+            # the settings dict
+            self._start_task(
+                self._on_settings_saved, "saved",
+                self.settings_manager.write_settings,
+                self.settings_manager.serialize_settings()
+            )
             
-            # Save to file
-            if self.settings_manager.save_settings():
+            if not self._wait_for_save:
+                # Apply immediate changes (UA, proxy, etc.) and close;
+                # _on_settings_saved reports a failed write
+                self.settings_manager.apply_runtime(self._changed_keys)
+                self._set_saving(False)
+                self.accept()
+            
+        except Exception as e:
+            self._set_saving(False)
+            self._show_message(
+                QMessageBox.Icon.Critical,
+                "Error",
+                f"An error occurred while saving: {str(e)}"
+            )
+    
+    def _on_settings_saved(self, _tag, ok):
+        """Finish saving once the settings file has been written.
+        
+        Args:
+            _tag: Task tag (unused)
+            ok: Result of settings_manager.save_settings()
+        """
+        if not self._wait_for_save:
+            # Dialog already closed
+            if ok:
+                self.saved.emit()
+            else:
+                self.save_failed.emit("Failed to save settings to file.")
+            return
+        
+        self._set_saving(False)
+        try:
+            if ok:
                 # Apply immediate changes (UA, proxy, etc.)
-                self.settings_manager.apply_proxy_settings()
-                self.settings_manager.apply_network_overrides()
+                self.settings_manager.apply_runtime(self._changed_keys)
                 
-                QMessageBox.information(
-                    self,
+                self._show_message(
+                    QMessageBox.Icon.Information,
                     "Settings Saved",
                     "Settings saved successfully!"
                 )
                 self.accept()
+                self.saved.emit()
             else:
-                QMessageBox.critical(
-                    self,
+                self._show_message(
+                    QMessageBox.Icon.Critical,
                     "Save Error",
                     "Failed to save settings to file."
                 )
                 
         except Exception as e:
-            QMessageBox.critical(
-                self,
+            self._show_message(
+                QMessageBox.Icon.Critical,
                 "Error",
                 f"An error occurred while saving: {str(e)}"
             )
     
+    def _show_message(self, icon, title, text):
+        """Show a modal message, reusing one QMessageBox per icon.
+        
+        Args:
+            icon: QMessageBox.Icon
+            title: Window title
+            text: Message text
+        """
+        box = self._message_boxes.get(icon)
+        if box is None:
+            box = QMessageBox(icon, "", "", QMessageBox.StandardButton.Ok, self)
+            self._message_boxes[icon] = box
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.exec()
+    
+    def _set_saving(self, busy):
+        """Disable the dialog buttons while a save is in progress."""
+        self.save_button.setText("Saving..." if busy else "Save")
+        self.save_button.setEnabled(not busy)
+        self.cancel_button.setEnabled(not busy)
+        self.reset_button.setEnabled(not busy)
+    
     def _validate_inputs(self):
-        """Validate all inputs before saving."""
+        """Validate all inputs before saving.
+        
+        All problems are reported together in one warning, and the tab of
+        the first one is selected.
+        """
+        errors = []  # (tab index, message)
+        
         # Validate URL
         url = self.start_url.text().strip()
         if not url:
-            QMessageBox.warning(self, "Invalid URL", "Start URL cannot be empty.")
-            self.tabs.setCurrentIndex(0)
-            return False
-        
-        if not url.startswith(("http://", "https://")):
-            self.start_url.setText("https://" + url)
+            errors.append((0, "Start URL cannot be empty."))
+        elif not _URL_RE.match(url):
+            url = "https://" + url
+            if _URL_RE.match(url):
+                self.start_url.setText(url)
+            else:
+                errors.append((0, "Start URL must not contain spaces."))
         
         # Validate window size (already constrained by spinbox, but double-check)
         if self.window_width.value() < 400 or self.window_height.value() < 300:
-            QMessageBox.warning(
-                self,
-                "Invalid Size",
-                "Window size must be at least 400x300."
-            )
-            self.tabs.setCurrentIndex(0)
-            return False
+            errors.append((0, "Window size must be at least 400x300."))
         
-        # Validate proxy port if manual mode
-        if self.proxy_mode.currentText() == "manual":
+        # Validate proxy port if manual mode (unopened tab = unchanged)
+        if 2 in self._tab_built and self.proxy_mode.currentText() == "manual":
             if not self.proxy_host.text().strip():
-                QMessageBox.warning(
-                    self,
-                    "Invalid Proxy",
-                    "Proxy host is required for manual mode."
-                )
-                self.tabs.setCurrentIndex(2)
-                return False
+                errors.append((2, "Proxy host is required for manual mode."))
             
             if self.proxy_port.value() == 0:
-                QMessageBox.warning(
-                    self,
-                    "Invalid Proxy",
-                    "Proxy port is required for manual mode."
-                )
-                self.tabs.setCurrentIndex(2)
-                return False
+                errors.append((2, "Proxy port is required for manual mode."))
+        
+        if errors:
+            self._show_message(
+                QMessageBox.Icon.Warning,
+                "Invalid Settings",
+                "Please fix the following:\n\n"
+                + "\n".join(f"\u2022 {message}" for _, message in errors)
+            )
+            self.tabs.setCurrentIndex(errors[0][0])
+            return False
         
         return True
@@ -6,71 +6,79 @@ Verify which version of settings_dialog.py you have.
 import sys
 import os
 
+# Features of the new dialog: (text to look for, description)
+_CHECKS = (
+    ('QTabWidget', 'Tabbed interface'),
+    ('_create_general_tab', 'General tab method'),
+    ('_create_privacy_tab', 'Privacy tab method'),
+    ('_create_proxy_tab', 'Proxy tab method'),
+    ('_create_logging_tab', 'Logging tab method'),
+    ('_create_scripting_tab', 'Scripting tab method'),
+    ('_create_advanced_tab', 'Advanced tab method'),
+    ('_browse_save_folder', 'Browse folder function'),
+    ('headers_global', 'Global headers'),
+    ('headers_per_host', 'Per-host headers'),
+    ('QFileDialog', 'File dialog'),
+    ('auto_launch', 'Auto-launch setting'),
+)
+
 def check_file(filepath):
     """Check if file is old or new version."""
     if not os.path.exists(filepath):
         print(f"❌ FILE NOT FOUND: {filepath}")
         return False
     
-    with open(filepath, 'r') as f:
+    # Searched as bytes; nothing needs decoding
+    with open(filepath, 'rb', buffering=1 << 18) as f:
         content = f.read()
     
     size = len(content)
-    lines = content.count('\n')
+    lines = content.count(b'\n')
     
-    print(f"\n{'='*60}")
-    print(f"Checking: {filepath}")
-    print(f"{'='*60}")
-    print(f"Size: {size:,} characters ({size//1024}KB)")
-    print(f"Lines: {lines}")
-    print()
+    # Collect the report and write it in one go
+    out = []
+    w = out.append
     
-    # Check for new features
-    checks = [
-        ('QTabWidget', 'Tabbed interface'),
-        ('_create_general_tab', 'General tab method'),
-        ('_create_privacy_tab', 'Privacy tab method'),
-        ('_create_proxy_tab', 'Proxy tab method'),
-        ('_create_logging_tab', 'Logging tab method'),
-        ('_create_scripting_tab', 'Scripting tab method'),
-        ('_create_advanced_tab', 'Advanced tab method'),
-        ('_browse_save_folder', 'Browse folder function'),
-        ('headers_global', 'Global headers'),
-        ('headers_per_host', 'Per-host headers'),
-        ('QFileDialog', 'File dialog'),
-        ('auto_launch', 'Auto-launch setting'),
-    ]
+    w(f"\n{'='*60}\n")
+    w(f"Checking: {filepath}\n")
+    w(f"{'='*60}\n")
+    w(f"Size: {size:,} bytes ({size//1024}KB)\n")
+    w(f"Lines: {lines}\n")
+    w("\n")
     
     found_count = 0
-    print("Feature Check:")
-    print("-" * 60)
-    for feature, desc in checks:
-        found = feature in content
+    w("Feature Check:\n")
+    w("-" * 60 + "\n")
+    for feature, desc in _CHECKS:
+        found = feature.encode() in content
         status = "✅" if found else "❌"
-        print(f"{status} {desc:<30} ({feature})")
+        w(f"{status} {desc:<30} ({feature})\n")
         if found:
             found_count += 1
     
-    print()
-    print(f"Found: {found_count}/{len(checks)} features")
-    print()
+    w("\n")
+    w(f"Found: {found_count}/{len(_CHECKS)} features\n")
+    w("\n")
     
     if found_count == 0:
-        print("🔴 THIS IS THE OLD DIALOG (NO NEW FEATURES)")
-        print("   - No tabs")
-        print("   - Single page layout")
-        print("   - ~250 lines, ~12KB")
-        return False
-    elif found_count < len(checks) // 2:
-        print("🟡 PARTIAL OR CORRUPTED FILE")
-        return False
+        w("🔴 THIS IS THE OLD DIALOG (NO NEW FEATURES)\n")
+        w("   - No tabs\n")
+        w("   - Single page layout\n")
+        w("   - ~250 lines, ~12KB\n")
+        is_new = False
+    elif found_count < len(_CHECKS) // 2:
+        w("🟡 PARTIAL OR CORRUPTED FILE\n")
+        is_new = False
     else:
-        print("🟢 THIS IS THE NEW ENHANCED DIALOG")
-        print("   - 6 tabs")
-        print("   - Browse buttons")
-        print("   - JSON validation")
-        print("   - ~930 lines, ~35KB")
-        return True
+        w("🟢 THIS IS THE NEW ENHANCED DIALOG\n")
+        w("   - 6 tabs\n")
+        w("   - Browse buttons\n")
+        w("   - JSON validation\n")
+        w("   - ~930 lines, ~35KB\n")
+        is_new = True
+    
+    sys.stdout.write("".join(out))
+    return is_new
 
 if __name__ == '__main__':
     if len(sys.argv) > 1:
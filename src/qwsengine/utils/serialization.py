@@ -0,0 +1,73 @@
+"""JSON helpers that use orjson when it is installed.
+
+orjson is optional; without it everything falls back to the stdlib json
+module. orjson.JSONDecodeError subclasses json.JSONDecodeError, so
+callers catch JSONDecodeError from here either way.
+"""
+
+import json
+from json import JSONDecodeError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = ['JSONDecodeError', 'loads', 'dumps_indented', 'dumps_indented_bytes']
+
+
+def loads(data):
+    """Parse JSON text or bytes.
+    
+    Args:
+        data: JSON document as str or bytes
+    
+    Returns:
+        Parsed object
+    
+    Raises:
+        JSONDecodeError: If data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_indented(obj) -> str:
+    """Serialize obj as JSON text indented by two spaces.
+    
+    Falls back to the stdlib for values orjson can't encode (e.g.
+    non-string dict keys).
+    
+    Args:
+        obj: Object to serialize
+    
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, indent=2)
+
+
+def dumps_indented_bytes(obj) -> bytes:
+    """Serialize obj as UTF-8 JSON indented by two spaces.
+    
+    Same output as dumps_indented(), but skips the str round trip when
+    the result is written straight to a binary file.
+    
+    Args:
+        obj: Object to serialize
+    
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, indent=2).encode('utf-8')